@@ -1,31 +1,106 @@
 from datetime import datetime, timedelta
+import functools
 import logging
 import os
-import platform
 import sys
+import threading
 import time
-import uuid
+from types import MappingProxyType
 
-from flask import jsonify, render_template
+from flask import Response, current_app, render_template
 import psutil
 
-from Services.utils import START_TIME, format_size, format_uptime, get_component_status
-
-# Basic logging
-logging.basicConfig(
-    level=logging.INFO, format="%(levelname)s - %(message)s"
+from Endpoints.status import get_metrics
+from Services.utils import (
+    START_TIME,
+    aggregate_status,
+    conditional_html_response,
+    format_size,
+    format_uptime,
+    get_cached_component_status,
+    timed_lru_cache,
 )
+
 logger = logging.getLogger(__name__)
 
+# The environment does not change while the process runs, so mask it once
+_ENV_VARS_FILTERED = MappingProxyType(
+    {
+        k: "***" if "key" in k.lower() or "token" in k.lower() else v
+        for k, v in os.environ.items()
+    }
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _static_sysinfo():
+    """Host facts that are fixed for the lifetime of the process.
+
+    Computed on the first diagnostics request rather than at import, since
+    platform.platform() probes OS release files.
+    """
+    import platform
+
+    return {
+        "platform": platform.platform(),
+        "python_version": sys.version,
+        "cpu_count": psutil.cpu_count(),
+    }
+
+
+@functools.lru_cache(maxsize=4)
+def _fmt_ts(epoch_sec, iso=False):
+    """Format a whole-second epoch timestamp; repeat calls within a second are cached."""
+    moment = datetime.fromtimestamp(epoch_sec)
+    return moment.isoformat() if iso else moment.strftime("%Y-%m-%d %H:%M:%S")
+
+
+# (error_type, message) -> (first_seen, serialized JSON body) for recent failures
+ERROR_CACHE_SECONDS = 10.0
+_error_cache = {}
+_error_cache_lock = threading.Lock()
+
+# Sample metrics
+_RESUME_PROC_TIMES = (1.2, 0.9, 1.5, 1.1, 1.3)
+_API_RESP_TIMES = (0.2, 0.3, 0.1, 0.2, 0.1)
+
+# Sample requests, timestamped relative to process start
+_SAMPLE_REQUESTS = (
+    {
+        "id": f"req-{os.urandom(4).hex()}",
+        "method": "POST",
+        "endpoint": "/api/upload",
+        "status": 200,
+        "duration": 0.35,
+        "timestamp": (
+            datetime.fromtimestamp(START_TIME) - timedelta(minutes=2)
+        ).strftime("%Y-%m-%d %H:%M:%S"),
+    },
+    {
+        "id": f"req-{os.urandom(4).hex()}",
+        "method": "POST",
+        "endpoint": "/api/optimize",
+        "status": 200,
+        "duration": 1.24,
+        "timestamp": (
+            datetime.fromtimestamp(START_TIME) - timedelta(minutes=1)
+        ).strftime("%Y-%m-%d %H:%M:%S"),
+    },
+)
+
+
+@timed_lru_cache(ttl=5)
+def _render_diagnostics():
+    """Collect diagnostics data and render the page, memoized for 5 seconds."""
+    now = time.time()
+    uptime = format_uptime(int(now - START_TIME))
 
-def diagnostics_page():
     # Get system information
-    memory = psutil.virtual_memory()
-    disk = psutil.disk_usage("/")
+    memory, disk, _ = get_metrics()
 
     # Fetch component status
     try:
-        components = get_component_status()
+        components = get_cached_component_status()
     except Exception as e:
         logger.error(f"Failed to get component status for diagnostics: {str(e)}")
         components = {
@@ -36,60 +111,17 @@ def diagnostics_page():
         }
 
     # Determine overall system status based on components
-    overall_status = "healthy"
-    for component_status in components.values():
-        if component_status.get("status") == "error":
-            overall_status = "error"
-            break
-        elif (
-            component_status.get("status") == "warning"
-            and overall_status != "error"
-        ):
-            overall_status = "warning"
+    overall_status = aggregate_status(components)
 
     # Placeholder for other variables (adjust as needed)
     active_connections = 0  # Replace with actual logic if available
     version = "0.1.0"  # Replace with actual version logic
     title = "System Diagnostics"
-    env_vars_filtered = {
-        k: "***" if "key" in k.lower() or "token" in k.lower() else v
-        for k, v in os.environ.items()
-    }
-    
-    # Sample metrics
-    resume_processing_times = [1.2, 0.9, 1.5, 1.1, 1.3]
-    api_response_times = [0.2, 0.3, 0.1, 0.2, 0.1]
-    
-    # Sample requests
-    recent_requests = [
-        {
-            "id": f"req-{uuid.uuid4().hex[:8]}",
-            "method": "POST",
-            "endpoint": "/api/upload",
-            "status": 200,
-            "duration": 0.35,
-            "timestamp": (datetime.now() - timedelta(minutes=2)).strftime(
-                "%Y-%m-%d %H:%M:%S"
-            ),
-        },
-        {
-            "id": f"req-{uuid.uuid4().hex[:8]}",
-            "method": "POST",
-            "endpoint": "/api/optimize",
-            "status": 200,
-            "duration": 1.24,
-            "timestamp": (datetime.now() - timedelta(minutes=1)).strftime(
-                "%Y-%m-%d %H:%M:%S"
-            ),
-        },
-    ]
     
     # Prepare diagnostic info in structured format for template
     system_info = {
-        "uptime": format_uptime(int(time.time() - START_TIME)),
-        "platform": platform.platform(),
-        "python_version": sys.version,
-        "cpu_count": psutil.cpu_count(),
+        **_static_sysinfo(),
+        "uptime": uptime,
         "memory": {
             "total": format_size(memory.total),
             "available": format_size(memory.available),
@@ -102,43 +134,68 @@ def diagnostics_page():
         },
     }
     
+    return render_template(
+        "diagnostics.html",
+        title=title,
+        system_status=overall_status,
+        active_connections=active_connections,
+        version=version,
+        components=components,
+        system_info=system_info,
+        uptime=uptime,
+        resume_processing_times=_RESUME_PROC_TIMES,
+        api_response_times=_API_RESP_TIMES,
+        recent_requests=_SAMPLE_REQUESTS,
+        transactions=[],
+        env_vars=_ENV_VARS_FILTERED,
+        pipeline_status={
+            "status": "unknown",
+            "message": "No pipeline data available",
+        },
+        pipeline_stages=[],
+        pipeline_history=[],
+        timestamp=_fmt_ts(int(now)),
+    )
+
+
+def _error_response(e):
+    """Build the JSON 500 for a failed render, reusing identical recent errors.
+
+    During an outage the same failure repeats on every poll, so the
+    serialized body is kept for ERROR_CACHE_SECONDS and served as-is.
+    """
+    key = (type(e).__name__, str(e))
+    now = time.monotonic()
+    with _error_cache_lock:
+        cached = _error_cache.get(key)
+        if cached and now - cached[0] < ERROR_CACHE_SECONDS:
+            logger.debug(f"Serving cached diagnostics error: {key[0]}")
+            body = cached[1]
+        else:
+            logger.error(
+                f"Error rendering diagnostics template: {str(e)}", exc_info=True
+            )
+            body = current_app.json.dumps(
+                {
+                    "status": "error",
+                    "error_type": key[0],
+                    "message": f"Error rendering diagnostics page: {key[1]}",
+                    "timestamp": _fmt_ts(int(time.time()), iso=True),
+                }
+            ).encode()
+            # Drop expired entries so distinct errors cannot accumulate
+            for stale in [
+                k for k, (seen, _) in _error_cache.items()
+                if now - seen >= ERROR_CACHE_SECONDS
+            ]:
+                del _error_cache[stale]
+            _error_cache[key] = (now, body)
+    return Response(body, status=500, mimetype="application/json")
+
+
+def diagnostics_page():
     # Gracefully handle template rendering
     try:
-        current_uptime = format_uptime(int(time.time() - START_TIME))
-        return render_template(
-            "diagnostics.html",
-            title=title,
-            system_status=overall_status,
-            active_connections=active_connections,
-            version=version,
-            components=components,
-                            system_info=system_info,
-            uptime=current_uptime,
-                            resume_processing_times=resume_processing_times,
-                            api_response_times=api_response_times,
-                            recent_requests=recent_requests,
-            transactions=[],
-            env_vars=env_vars_filtered,
-            pipeline_status={
-                "status": "unknown",
-                "message": "No pipeline data available",
-            },
-                            pipeline_stages=[],
-                            pipeline_history=[],
-            timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        )
+        return conditional_html_response(_render_diagnostics())
     except Exception as e:
-        logger.error(
-            f"Error rendering diagnostics template: {str(e)}", exc_info=True
-        )
-        return (
-            jsonify(
-                {
-            "status": "error",
-                    "error_type": type(e).__name__,
-                    "message": f"Error rendering diagnostics page: {str(e)}",
-                    "timestamp": datetime.now().isoformat(),
-                }
-            ),
-            500,
-        )
\ No newline at end of file
+        return _error_response(e)
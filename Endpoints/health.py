@@ -11,14 +11,9 @@ from Services.openai_interface import OPENAI_API_BASE, OPENAI_API_KEY
 from Services.utils import format_size, get_uptime
 
 
-
-logging.basicConfig(
-    level=logging.INFO, format="%(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
 
-
 def health_page():
 
     health_data = {
@@ -1,23 +1,103 @@
 import logging
+import threading
+import time
 
-from flask import jsonify, render_template
+from flask import jsonify, render_template, request
 import psutil
 
+from Services import cpu_meter
 from Services.database import get_db
 from Services.diagnostic_system import get_diagnostic_system
-from Services.utils import get_component_status, get_uptime
+from Services.utils import (
+    aggregate_status,
+    conditional_html_response,
+    get_cached_component_status,
+    get_uptime,
+    timed_lru_cache,
+)
 
 
-logging.basicConfig(
-    level=logging.INFO, format="%(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
 diagnostic_system = get_diagnostic_system()
 
-def status_page():
+
+# Latest database health check result, refreshed by the background checker below
+_db_status_cache = {}
+_db_status_lock = threading.Lock()
+_db_checker_started = False
+DB_CHECK_INTERVAL = 5.0
+
+
+def _check_db():
+    db = None
+    while True:
+        try:
+            if db is None:
+                db = get_db()
+            db_check = (
+                db.health_check()
+                if hasattr(db, "health_check")
+                else {"status": "unknown"}
+            )
+        except Exception as e:
+            logger.error(f"Failed to check database status: {str(e)}")
+            db = None
+            db_check = {
+                "status": "error",
+                "message": f"Database error: {str(e)}",
+                "tables": [],
+            }
+        with _db_status_lock:
+            _db_status_cache.clear()
+            _db_status_cache.update(db_check)
+        time.sleep(DB_CHECK_INTERVAL)
+
+
+def _start_db_checker():
+    """Start the background database checker on first use, so importing this module has no side effects."""
+    global _db_checker_started
+    with _db_status_lock:
+        if _db_checker_started:
+            return
+        _db_checker_started = True
+    threading.Thread(target=_check_db, name="db-health-check", daemon=True).start()
+
+
+class _MetricsCache:
+    """Short-lived snapshot of psutil metrics shared across requests."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.timestamp = 0.0
+        self.memory = None
+        self.disk = None
+
+    def get(self, max_age):
+        with self.lock:
+            now = time.monotonic()
+            if self.memory is None or now - self.timestamp >= max_age:
+                self.memory = psutil.virtual_memory()
+                self.disk = psutil.disk_usage("/")
+                self.timestamp = now
+            return self.memory, self.disk, cpu_meter.cpu_percent()
+
+
+_metrics_cache = _MetricsCache()
+
+
+def get_metrics(max_age=2.0):
+    """Return cached (memory, disk, cpu_percent), refreshed every max_age seconds.
+
+    cpu_percent is None until the CPU meter has taken its first sample.
+    """
+    return _metrics_cache.get(max_age)
+
+
+def _collect_status():
+    """Gather component, database, system and transaction status."""
     try:
-        components = get_component_status()
+        components = get_cached_component_status()
     except Exception as e:
         logger.error(f"Failed to get component status: {str(e)}")
         components = {
@@ -30,44 +110,25 @@ def status_page():
     
     # Get system metrics with fallbacks
     try:
-        memory = psutil.virtual_memory()
-        cpu_percent = psutil.cpu_percent(interval=0.1)
+        memory, _, cpu_percent = get_metrics()
     except Exception as e:
         logger.error(f"Failed to get system metrics: {str(e)}")
         memory = None
         cpu_percent = None
     
     # Determine overall system status based on component statuses
-    overall_status = "healthy"
-    for component in components.values():
-        if component.get("status") == "error":
-            overall_status = "error"
-            break
-        elif component.get("status") == "warning" and overall_status != "error":
-            overall_status = "warning"
+    overall_status = aggregate_status(components)
     
-    # Create a database status object with fallbacks
-    try:
-        db = get_db()
-        db_check = (
-            db.health_check()
-            if hasattr(db, "health_check")
-            else {"status": "unknown"}
-        )
-        database_status = {
-            "status": db_check.get("status", "unknown"),
-            "message": db_check.get("message", "Database status unknown"),
-            "tables": db_check.get(
-                "tables", ["resumes", "optimizations", "users"]
-            ),  # Example tables
-        }
-    except Exception as e:
-        logger.error(f"Failed to check database status: {str(e)}")
-        database_status = {
-            "status": "error",
-            "message": f"Database error: {str(e)}",
-            "tables": [],
-        }
+    # Create a database status object from the last background check
+    with _db_status_lock:
+        db_check = dict(_db_status_cache) or {"status": "unknown"}
+    database_status = {
+        "status": db_check.get("status", "unknown"),
+        "message": db_check.get("message", "Database status unknown"),
+        "tables": db_check.get(
+            "tables", ["resumes", "optimizations", "users"]
+        ),  # Example tables
+    }
     
     # System info with fallbacks
     system_info = {
@@ -90,25 +151,70 @@ def status_page():
         logger.error(f"Failed to get transaction history: {str(e)}")
         recent_transactions = []
     
+    return {
+        "status": overall_status,
+        "components": components,
+        "database_status": database_status,
+        "system_info": system_info,
+        "recent_transactions": recent_transactions,
+    }
+
+
+@timed_lru_cache(ttl=5)
+def _render_status():
+    """Render the status page, memoized for 5 seconds.
+
+    Returns (body, None) on success, or (None, fallback) where fallback is the
+    JSON payload to serve when the template fails to render.
+    """
+    status = _collect_status()
+
     # Render the template with error handling
     try:
-        return render_template(
+        body = render_template(
             "status.html",
-                            system_info=system_info,
-                            database_status=database_status,
-            recent_transactions=recent_transactions,
+            system_info=status["system_info"],
+            database_status=status["database_status"],
+            recent_transactions=status["recent_transactions"],
         )
+        return body, None
     except Exception as e:
         logger.error(f"Error rendering status template: {str(e)}")
-        # Fall back to JSON response on template error
+        return None, {
+            "status": status["status"],
+            "system_info": status["system_info"],
+            "components": status["components"],
+            "error": f"Template error: {str(e)}",
+        }
+
+
+def _wants_json():
+    """Return True for programmatic clients that asked for JSON."""
+    return (
+        "application/json" in request.headers.get("Accept", "")
+        or request.args.get("format") == "json"
+    )
+
+
+def status_page():
+    _start_db_checker()
+    # Machine clients (load balancers, monitors) skip template rendering
+    if _wants_json():
+        status = _collect_status()
         return (
             jsonify(
                 {
-            "status": overall_status,
-            "system_info": system_info,
-            "components": components,
-                    "error": f"Template error: {str(e)}",
+                    "status": status["status"],
+                    "system_info": status["system_info"],
+                    "components": status["components"],
+                    "database": status["database_status"],
                 }
             ),
             200,
-        )  # Return 200 even for errors
\ No newline at end of file
+        )
+
+    body, fallback = _render_status()
+    if body is None:
+        # Fall back to JSON response on template error
+        return jsonify(fallback), 200  # Return 200 even for errors
+    return conditional_html_response(body)
@@ -6,16 +6,45 @@ and semantic matching between keywords and resume bullet points.
 """
 
 import os
+import csv
 import json
 import logging
+import random
+import time
+import hashlib
+import sqlite3
+import threading
+import dataclasses
+import functools
+from collections import OrderedDict
+from dataclasses import dataclass, field
 import numpy as np
-from typing import Dict, List, Any, Optional, Tuple, Set
-import pandas as pd
+from typing import Dict, List, Any, Optional, Tuple, Set, Iterable
 import httpx
-import copy
+from concurrent.futures import ThreadPoolExecutor
+
+# SimSIMD provides SIMD cosine kernels; optional, NumPy is used when it is missing
+try:
+    import simsimd
+except ImportError:
+    simsimd = None
+
+# SciPy's connected_components groups duplicate keywords in C; optional, union-find is used when it is missing
+try:
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.csgraph import connected_components
+except ImportError:
+    connected_components = None
+
+# orjson writes the results file several times faster; optional, json is used when it is missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Import OpenAI
 try:
+    import openai
     from openai import OpenAI
 except ImportError:
     raise ImportError("OpenAI Python package is required. Install with: pip install openai")
@@ -27,6 +56,310 @@ logging.basicConfig(
 )
 logger = logging.getLogger("semantic_matcher")
 
+# Persistent embedding cache location, outside the source tree (the user's cache
+# directory); set EMBEDDING_CACHE_PATH="" to keep only the in-process cache
+EMBEDDING_CACHE_PATH = os.environ.get(
+    "EMBEDDING_CACHE_PATH",
+    os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+        "resume_optimizer",
+        "embeddings.sqlite3",
+    ),
+)
+
+
+# System message shared by every skill categorization request
+_CATEGORIZATION_SYSTEM_MESSAGE = {"role": "system", "content": "You are an expert in categorizing technical skills."}
+
+# Retry policy for embedding requests: transient errors are retried with jittered
+# exponential backoff (or the server's Retry-After). This is the only retry layer
+# (the client is built with max_retries=0), and all retries for one batch call
+# share EMBEDDING_RETRY_DEADLINE seconds; past that the affected texts are skipped.
+EMBEDDING_MAX_ATTEMPTS = 6
+EMBEDDING_RETRY_MAX_WAIT = 20.0
+EMBEDDING_RETRY_DEADLINE = 60.0
+_RETRYABLE_EMBEDDING_ERRORS = (
+    openai.RateLimitError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+    httpx.TimeoutException,
+)
+
+
+def _retry_delay(error: Exception, attempt: int) -> float:
+    """Seconds to wait before retrying after error on the given (1-based) attempt."""
+    response = getattr(error, "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    if retry_after:
+        try:
+            return min(float(retry_after), EMBEDDING_RETRY_MAX_WAIT)
+        except ValueError:
+            pass
+    return random.uniform(1.0, min(EMBEDDING_RETRY_MAX_WAIT, 2.0 ** attempt))
+
+
+# Cached embeddings are stored as int8, each row scaled so its largest component maps to +/-127
+INT8_MAX = 127
+
+
+def _quantize_rows(matrix: np.ndarray) -> np.ndarray:
+    """
+    Quantize rows to int8 for storage (4x smaller than float32).
+    
+    Each row gets its own scale, 127 / max|x|, so the whole int8 range is used.
+    The scale is not kept: cached rows are renormalized when read, which
+    cancels it.
+    """
+    scale = INT8_MAX / np.clip(np.abs(matrix).max(axis=1, keepdims=True), 1e-12, None)
+    return np.round(matrix * scale).astype(np.int8)
+
+
+def _normalize_vector(vector) -> np.ndarray:
+    """Return vector as an L2-normalized float32 array."""
+    vector = np.asarray(vector, dtype=np.float32)
+    return vector / max(float(np.linalg.norm(vector)), 1e-12)
+
+
+def _stack_embeddings(vectors: List[np.ndarray]) -> np.ndarray:
+    """Stack L2-normalized embedding vectors into one float32 matrix (one row per vector)."""
+    if not vectors:
+        return np.empty((0, 0), dtype=np.float32)
+    return np.vstack(vectors).astype(np.float32, copy=False)
+
+
+def _cosine_matrix(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Pairwise cosine similarity between the L2-normalized float32 rows of a and b."""
+    if simsimd is not None:
+        return 1.0 - np.asarray(simsimd.cdist(a, b, metric="cosine"))
+    # Rows are unit length, so the dot product is the cosine
+    return a @ b.T
+
+
+def _union_find_groups(n: int, pairs: Iterable[Tuple[int, int]]) -> List[List[int]]:
+    """
+    Cluster indices 0..n-1 into connected components given linked index pairs.
+    
+    Returns:
+        list: Groups of indices, each sorted ascending, ordered by first index
+    """
+    parent = list(range(n))
+    
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+    
+    for i, j in pairs:
+        root_i, root_j = find(int(i)), find(int(j))
+        if root_i != root_j:
+            parent[max(root_i, root_j)] = min(root_i, root_j)
+    
+    groups: Dict[int, List[int]] = {}
+    for i in range(n):
+        groups.setdefault(find(i), []).append(i)
+    return list(groups.values())
+
+
+def _connected_groups(n: int, pairs: List[Tuple[int, int]]) -> List[List[int]]:
+    """
+    Same grouping as _union_find_groups, computed with SciPy when it is installed.
+    """
+    if connected_components is None or not pairs:
+        return _union_find_groups(n, pairs)
+    rows, cols = np.asarray(pairs, dtype=np.int64).T
+    graph = coo_matrix((np.ones(len(rows), dtype=np.int8), (rows, cols)), shape=(n, n))
+    _, labels = connected_components(graph, directed=False)
+    groups: Dict[int, List[int]] = {}
+    for i, label in enumerate(labels.tolist()):
+        groups.setdefault(label, []).append(i)
+    return list(groups.values())
+
+
+@dataclass(slots=True)
+class KeywordRec:
+    """A JD keyword moving through the matching pipeline."""
+    keyword: str
+    context: str
+    relevance_score: float = 0
+    skill_type: Optional[str] = None
+    synonyms: List[Dict[str, str]] = field(default_factory=list)
+    assigned_category: Optional[str] = None
+    embedding: Optional[np.ndarray] = None
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "KeywordRec":
+        return cls(
+            keyword=data["keyword"],
+            context=data["context"],
+            relevance_score=data.get("relevance_score", 0),
+            skill_type=data.get("skill_type"),
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict for results; embeddings are not included."""
+        return {
+            "keyword": self.keyword,
+            "context": self.context,
+            "relevance_score": self.relevance_score,
+            "skill_type": self.skill_type,
+            "synonyms": self.synonyms,
+        }
+
+
+@dataclass(slots=True)
+class BulletRec:
+    """A resume bullet point and where it came from."""
+    bullet_text: str
+    company: str
+    position: str
+    section: str
+    experience_idx: int
+    bullet_idx: int
+
+
+@dataclass(slots=True)
+class SkillBlock:
+    """The skills of one category as parallel arrays (one entry per skill)."""
+    names: List[str]
+    embeddings: np.ndarray
+    relevance: np.ndarray
+    is_original: np.ndarray
+    jd_context: List[Optional[str]]
+    
+    def __len__(self) -> int:
+        return len(self.names)
+    
+    def take(self, indices) -> "SkillBlock":
+        """Block holding only the skills at indices, in that order."""
+        indices = np.asarray(indices, dtype=np.intp)
+        return SkillBlock(
+            names=[self.names[i] for i in indices],
+            embeddings=self.embeddings[indices],
+            relevance=self.relevance[indices],
+            is_original=self.is_original[indices],
+            jd_context=[self.jd_context[i] for i in indices],
+        )
+    
+    def extend(self, other: "SkillBlock") -> "SkillBlock":
+        """Block holding these skills followed by other's."""
+        return SkillBlock(
+            names=self.names + other.names,
+            embeddings=np.concatenate([self.embeddings, other.embeddings]),
+            relevance=np.concatenate([self.relevance, other.relevance]),
+            is_original=np.concatenate([self.is_original, other.is_original]),
+            jd_context=self.jd_context + other.jd_context,
+        )
+
+
+class EmbeddingCache:
+    """
+    Store of embedding vectors keyed by (model, sha256(text)): an in-process LRU
+    in front of an optional SQLite file.
+    
+    Embeddings are deterministic for a given model, so repeated resumes and
+    job descriptions can be served without calling the API. Vectors must be
+    L2-normalized; both in memory and on disk they are stored int8-quantized
+    and they are always returned as normalized float32.
+    """
+    
+    def __init__(self, path: Optional[str], memory_size: int = 4096):
+        self.path = path
+        self.memory_size = memory_size
+        # Quantized int8 rows, a quarter of the float32 footprint
+        self._memory: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._memory_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._conn = None
+        if not path:
+            return
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings_q8 (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+            self._conn.commit()
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Embedding cache unavailable at {path}: {e}. Continuing without cache.")
+            self._conn = None
+    
+    @staticmethod
+    def make_key(model: str, text: str) -> str:
+        return f"{model}:{hashlib.sha256(text.encode('utf-8')).hexdigest()}"
+    
+    def get_many(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        """Return cached vectors for whichever of keys are present."""
+        quantized = {}
+        with self._memory_lock:
+            for key in keys:
+                row = self._memory.get(key)
+                if row is not None:
+                    self._memory.move_to_end(key)
+                    quantized[key] = row
+        found = {key: _normalize_vector(row) for key, row in quantized.items()}
+        disk_keys = [key for key in keys if key not in found]
+        if self._conn is None or not disk_keys:
+            return found
+        from_disk = {}
+        try:
+            with self._lock:
+                # Stay well below SQLite's bound-parameter limit
+                for start in range(0, len(disk_keys), 500):
+                    chunk = disk_keys[start:start + 500]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = self._conn.execute(
+                        f"SELECT key, vector FROM embeddings_q8 WHERE key IN ({placeholders})", chunk
+                    ).fetchall()
+                    for key, blob in rows:
+                        from_disk[key] = np.frombuffer(blob, dtype=np.int8)
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache read failed: {e}")
+        self._remember(from_disk)
+        found.update((key, _normalize_vector(row)) for key, row in from_disk.items())
+        return found
+    
+    def _remember(self, items: Dict[str, np.ndarray]) -> None:
+        """Add int8 rows to the in-process LRU, evicting the least recently used entries."""
+        with self._memory_lock:
+            for key, vector in items.items():
+                self._memory[key] = vector
+                self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+    
+    def set_many(self, items: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        Store vectors and return them as later cache hits will (quantized and
+        renormalized), so callers can use the same values whether or not a
+        vector came from the cache.
+        """
+        if not items:
+            return {}
+        keys = list(items)
+        quantized = _quantize_rows(np.vstack([items[key] for key in keys]))
+        # Copy rows so evicting one does not pin the whole batch matrix
+        self._remember({key: row.copy() for key, row in zip(keys, quantized)})
+        stored = {key: _normalize_vector(row) for key, row in zip(keys, quantized)}
+        if self._conn is None:
+            return stored
+        try:
+            with self._lock:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings_q8 (key, vector) VALUES (?, ?)",
+                    [(key, row.tobytes()) for key, row in zip(keys, quantized)],
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache write failed: {e}")
+        return stored
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_embedding_cache(path: str) -> EmbeddingCache:
+    """One cache per path for the whole process, so matchers created per job share hits."""
+    return EmbeddingCache(path)
+
 
 class SemanticMatcher:
     """
@@ -48,9 +381,14 @@ class SemanticMatcher:
         
         # Use explicit httpx client to avoid proxy issues on Render
         try:
-            # Explicitly create httpx client, disabling environment proxy usage
-            httpx_client = httpx.Client(trust_env=False)
-            self.client = OpenAI(api_key=self.api_key, http_client=httpx_client)
+            # Explicitly create httpx client, disabling environment proxy usage.
+            # Pool limits allow concurrent embedding batches to reuse keep-alive connections.
+            httpx_client = httpx.Client(
+                trust_env=False,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+            )
+            # Retries are handled by _create_embeddings, not stacked on the client's own
+            self.client = OpenAI(api_key=self.api_key, http_client=httpx_client, max_retries=0)
             logger.info("SemanticMatcher: OpenAI client initialized successfully with custom httpx client.")
         except Exception as e:
             logger.error(f"SemanticMatcher: Failed to initialize OpenAI client: {e}", exc_info=True)
@@ -66,6 +404,11 @@ class SemanticMatcher:
         self.similarity_threshold = 0.75
         self.skill_similarity_threshold = 0.90 # For deduplicating skills
         
+        # Shared in-process + persistent embedding cache and its counters
+        self.embedding_cache = _shared_embedding_cache(EMBEDDING_CACHE_PATH)
+        self.cache_hits = 0
+        self.cache_misses = 0
+
     def process_keywords_and_resume(self, 
                                    keywords_data: Dict[str, Any], 
                                    resume_data: Dict[str, Any],
@@ -90,19 +433,24 @@ class SemanticMatcher:
         
         # --- Bullet Point Processing ---
         logger.info("Step 1: Generating embeddings for JD keywords (for bullets)")
-        keywords_with_embeddings = self.generate_keyword_embeddings(keywords_data["keywords"])
+        keywords_with_embeddings, keyword_embeddings = self.generate_keyword_embeddings(keywords_data["keywords"])
         
         logger.info("Step 2: Deduplicating JD keywords (for bullets)")
-        deduplicated_keywords_for_bullets = self.deduplicate_keywords(keywords_with_embeddings)
+        deduplicated_keywords_for_bullets, deduplicated_embeddings = self.deduplicate_keywords(
+            keywords_with_embeddings, keyword_embeddings
+        )
         
         logger.info("Step 3: Extracting bullet points from resume")
         bullet_points = self.extract_bullet_points(resume_data)
         
         logger.info(f"Step 4: Generating embeddings for {len(bullet_points)} bullet points")
-        bullets_with_embeddings = self.generate_bullet_embeddings(bullet_points)
+        bullets_with_embeddings, bullet_embeddings = self.generate_bullet_embeddings(bullet_points)
         
         logger.info("Step 5: Calculating similarity between JD keywords and resume bullets")
-        similarity_results = self.calculate_similarity(deduplicated_keywords_for_bullets, bullets_with_embeddings)
+        similarity_results = self.calculate_similarity(
+            deduplicated_keywords_for_bullets, deduplicated_embeddings,
+            bullets_with_embeddings, bullet_embeddings
+        )
         
         logger.info("Step 6: Grouping matches by bullet point")
         matches_by_bullet = self.group_matches_by_bullet(similarity_results)
@@ -113,8 +461,9 @@ class SemanticMatcher:
         
         logger.info("Step 8: Filtering JD keywords for hard skills relevant to skills section")
         jd_hard_skills_for_section = [
-            kw for kw in keywords_with_embeddings # Use keywords_with_embeddings to have their embeddings ready
-            if kw.get("skill_type") == "hard skill" and kw.get("relevance_score", 0) >= relevance_threshold
+            dataclasses.replace(kw, embedding=keyword_embeddings[i]) # Attach the already computed embedding row
+            for i, kw in enumerate(keywords_with_embeddings)
+            if kw.skill_type == "hard skill" and kw.relevance_score >= relevance_threshold
         ]
         logger.debug(f"Found {len(jd_hard_skills_for_section)} JD hard skills meeting relevance threshold {relevance_threshold}")
 
@@ -132,7 +481,7 @@ class SemanticMatcher:
 
         # Create result dictionary
         result = {
-            "deduplicated_keywords_for_bullets": [k for k in deduplicated_keywords_for_bullets if "embedding" not in k],
+            "deduplicated_keywords_for_bullets": [kw.to_dict() for kw in deduplicated_keywords_for_bullets],
             "similarity_results": similarity_results,
             "matches_by_bullet": matches_by_bullet,
             "final_technical_skills": final_technical_skills, # New addition
@@ -147,6 +496,8 @@ class SemanticMatcher:
                 "jd_hard_skills_considered_for_section": len(jd_hard_skills_for_section),
                 "final_skill_categories_count": len(final_technical_skills),
                 "final_total_technical_skills": sum(len(sks) for sks in final_technical_skills.values()),
+                "embedding_cache_hits": self.cache_hits,
+                "embedding_cache_misses": self.cache_misses,
             },
             "skill_selection_process_log": skill_selection_log
         }
@@ -154,7 +505,7 @@ class SemanticMatcher:
         logger.info(f"Semantic processing complete. Found {result['statistics']['total_bullet_matches']} bullet matches. Selected {result['statistics']['final_total_technical_skills']} technical skills.")
         return result
     
-    def generate_keyword_embeddings(self, keywords: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def generate_keyword_embeddings(self, keywords: List[Dict[str, Any]]) -> Tuple[List[KeywordRec], np.ndarray]:
         """
         Generate embeddings for keywords with context.
         
@@ -162,102 +513,77 @@ class SemanticMatcher:
             keywords: List of keywords with metadata
             
         Returns:
-            list: Keywords with embeddings added
+            tuple: (records for keywords that were embedded, L2-normalized float32 matrix with one row per keyword)
         """
-        keywords_with_embeddings = []
-        
+        records = []
         for keyword in keywords:
             try:
-                # Combine keyword and context for richer embedding
-                text = f"{keyword['keyword']}: {keyword['context']}"
-                
-                # Generate embedding
-                embedding = self._get_embedding(text)
-                
-                # Add embedding to keyword data
-                keyword_with_embedding = keyword.copy()
-                keyword_with_embedding["embedding"] = embedding
-                keywords_with_embeddings.append(keyword_with_embedding)
-                
-            except Exception as e:
-                logger.error(f"Error generating embedding for keyword '{keyword.get('keyword')}': {str(e)}")
-                # Skip this keyword if embedding generation fails
+                records.append(KeywordRec.from_dict(keyword))
+            except KeyError as e:
+                logger.error(f"Error generating embedding for keyword '{keyword.get('keyword')}': missing field {e}")
+                # Skip keywords without a name or context, as the matcher needs both
+        
+        # Combine keyword and context for richer embedding
+        texts = [f"{record.keyword}: {record.context}" for record in records]
+        embeddings = self._get_embeddings_batch(texts)
         
-        return keywords_with_embeddings
+        # Skip keywords whose embedding generation failed
+        embedded = [i for i, embedding in enumerate(embeddings) if embedding is not None]
+        return [records[i] for i in embedded], _stack_embeddings([embeddings[i] for i in embedded])
     
-    def deduplicate_keywords(self, keywords_with_embeddings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def deduplicate_keywords(self,
+                             keywords: List[KeywordRec],
+                             embeddings: np.ndarray) -> Tuple[List[KeywordRec], np.ndarray]:
         """
         Deduplicate keywords using embedding similarity.
         
         Args:
-            keywords_with_embeddings: Keywords with embeddings
+            keywords: Keywords with metadata
+            embeddings: Normalized keyword embeddings, one row per keyword
             
         Returns:
-            list: Deduplicated keywords
+            tuple: (deduplicated keywords with synonyms, their embedding rows)
         """
         # Skip if too few keywords
-        if len(keywords_with_embeddings) <= 1:
-            return keywords_with_embeddings
-            
-        # Group similar keywords
-        # Track which keywords have been processed
-        processed_indices = set()
-        grouped_keywords = []
+        if len(keywords) <= 1:
+            return keywords, embeddings
         
-        # Process each keyword
-        for i, kw1 in enumerate(keywords_with_embeddings):
-            if i in processed_indices:
-                continue
-                
-            # Find similar keywords
-            similar_group = [kw1]
-            processed_indices.add(i)
+        # Case/whitespace variants of the same keyword are merged without comparing embeddings
+        buckets: Dict[str, List[int]] = {}
+        for i, keyword in enumerate(keywords):
+            buckets.setdefault(" ".join(keyword.keyword.lower().split()), []).append(i)
+        representatives = [members[0] for members in buckets.values()]
+        duplicate_pairs = [(members[0], j) for members in buckets.values() for j in members[1:]]
+        
+        # Cosine similarity for every pair of distinct keywords in one matrix product
+        representative_embeddings = embeddings[representatives]
+        similarity = _cosine_matrix(representative_embeddings, representative_embeddings)
+        
+        # High threshold to avoid false matches; similar pairs are merged transitively
+        duplicate_pairs.extend(
+            (representatives[i], representatives[j])
+            for i, j in np.argwhere(np.triu(similarity > 0.92, k=1))
+        )
+        groups = _connected_groups(len(keywords), duplicate_pairs)
+        
+        grouped_keywords = []
+        primary_indices = []
+        for group in groups:
+            # Sort by relevance score; take the highest relevance keyword as primary
+            group.sort(key=lambda i: keywords[i].relevance_score, reverse=True)
+            primary_idx = group[0]
             
-            for j, kw2 in enumerate(keywords_with_embeddings):
-                if j in processed_indices or i == j:
-                    continue
-                    
-                # Calculate cosine similarity between embeddings
-                similarity = self._cosine_similarity(kw1["embedding"], kw2["embedding"])
-                
-                # If very similar (high threshold to be conservative)
-                if similarity > 0.92:  # High threshold to avoid false matches
-                    similar_group.append(kw2)
-                    processed_indices.add(j)
+            # Create list of synonyms
+            synonyms = [{"keyword": keywords[i].keyword, "context": keywords[i].context} 
+                       for i in group[1:]]
             
-            # Group the similar keywords
-            if len(similar_group) > 1:
-                # Sort by relevance score
-                similar_group.sort(key=lambda x: x.get("relevance_score", 0), reverse=True)
-                
-                # Take the highest relevance keyword as primary
-                primary = similar_group[0]
-                
-                # Create list of synonyms
-                synonyms = [{"keyword": kw["keyword"], "context": kw["context"]} 
-                           for kw in similar_group[1:]]
-                
-                # Add synonyms to the primary keyword
-                primary_with_synonyms = primary.copy()
-                primary_with_synonyms["synonyms"] = synonyms
-                
-                grouped_keywords.append(primary_with_synonyms)
-            else:
-                # No duplicates found, add the single keyword
-                kw1_copy = kw1.copy()
-                kw1_copy["synonyms"] = []
-                grouped_keywords.append(kw1_copy)
+            # Add synonyms to the primary keyword
+            grouped_keywords.append(dataclasses.replace(keywords[primary_idx], synonyms=synonyms))
+            primary_indices.append(primary_idx)
         
-        # Add any remaining unprocessed keywords
-        for i, kw in enumerate(keywords_with_embeddings):
-            if i not in processed_indices:
-                kw_copy = kw.copy()
-                kw_copy["synonyms"] = []
-                grouped_keywords.append(kw_copy)
-        
-        return grouped_keywords
+        return grouped_keywords, embeddings[primary_indices]
     
-    def extract_bullet_points(self, resume_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def extract_bullet_points(self, resume_data: Dict[str, Any]) -> List[BulletRec]:
         """
         Extract bullet points from resume JSON.
         
@@ -275,20 +601,20 @@ class SemanticMatcher:
             position = experience.get("title", "")
             
             for bullet_idx, bullet in enumerate(experience.get("responsibilities/achievements", [])):
-                bullet_points.append({
-                    "bullet_text": bullet,
-                    "company": company,
-                    "position": position,
-                    "section": "Experience",
-                    "experience_idx": experience_idx,
-                    "bullet_idx": bullet_idx
-                })
+                bullet_points.append(BulletRec(
+                    bullet_text=bullet,
+                    company=company,
+                    position=position,
+                    section="Experience",
+                    experience_idx=experience_idx,
+                    bullet_idx=bullet_idx
+                ))
         
         # Could also extract from other sections like Projects if needed
         logger.debug(f"Extracted {len(bullet_points)} bullet points from resume.")
         return bullet_points
     
-    def generate_bullet_embeddings(self, bullet_points: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def generate_bullet_embeddings(self, bullet_points: List[BulletRec]) -> Tuple[List[BulletRec], np.ndarray]:
         """
         Generate embeddings for bullet points.
         
@@ -296,71 +622,63 @@ class SemanticMatcher:
             bullet_points: List of bullet points with metadata
             
         Returns:
-            list: Bullet points with embeddings added
+            tuple: (bullet points that were embedded, L2-normalized float32 matrix with one row per bullet)
         """
-        bullets_with_embeddings = []
+        embeddings = self._get_embeddings_batch([bullet.bullet_text for bullet in bullet_points])
         
-        for bullet in bullet_points:
-            try:
-                # Generate embedding for the bullet text
-                embedding = self._get_embedding(bullet["bullet_text"])
-                
-                # Add embedding to bullet data
-                bullet_with_embedding = bullet.copy()
-                bullet_with_embedding["embedding"] = embedding
-                bullets_with_embeddings.append(bullet_with_embedding)
-                
-            except Exception as e:
-                logger.error(f"Error generating embedding for bullet '{bullet['bullet_text'][:30]}...': {str(e)}")
-                # Skip this bullet if embedding generation fails
+        # Skip bullets whose embedding generation failed
+        embedded = [i for i, embedding in enumerate(embeddings) if embedding is not None]
         
-        logger.debug(f"Generated embeddings for {len(bullets_with_embeddings)} bullet points.")
-        return bullets_with_embeddings
+        logger.debug(f"Generated embeddings for {len(embedded)} bullet points.")
+        return [bullet_points[i] for i in embedded], _stack_embeddings([embeddings[i] for i in embedded])
     
     def calculate_similarity(self, 
-                            keywords: List[Dict[str, Any]], 
-                            bullets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+                            keywords: List[KeywordRec], 
+                            keyword_embeddings: np.ndarray,
+                            bullets: List[BulletRec],
+                            bullet_embeddings: np.ndarray) -> List[Dict[str, Any]]:
         """
         Calculate cosine similarity between keywords and bullets.
         
         Args:
-            keywords: Keywords with embeddings
-            bullets: Bullets with embeddings
+            keywords: Keywords with metadata
+            keyword_embeddings: Normalized keyword embeddings, one row per keyword
+            bullets: Bullets with metadata
+            bullet_embeddings: Normalized bullet embeddings, one row per bullet
             
         Returns:
             list: Similarity results
         """
         similarity_results = []
+        if not keywords or not bullets:
+            return similarity_results
         
-        for keyword in keywords:
-            keyword_embedding = keyword["embedding"]
+        # Cosine similarity for every (keyword, bullet) pair in one matrix product
+        similarity = _cosine_matrix(keyword_embeddings, bullet_embeddings)
+        
+        # Only keep matches above threshold
+        for keyword_idx, bullet_idx in zip(*np.nonzero(similarity >= self.similarity_threshold)):
+            keyword = keywords[keyword_idx]
+            bullet = bullets[bullet_idx]
             
-            for bullet in bullets:
-                bullet_embedding = bullet["embedding"]
-                
-                # Calculate cosine similarity
-                similarity = self._cosine_similarity(keyword_embedding, bullet_embedding)
-                
-                # Only keep matches above threshold
-                if similarity >= self.similarity_threshold:
-                    # Create result without embeddings
-                    result = {
-                        "keyword": keyword["keyword"],
-                        "keyword_context": keyword["context"],
-                        "relevance_score": keyword["relevance_score"],
-                        "skill_type": keyword["skill_type"],
-                        "bullet_text": bullet["bullet_text"],
-                        "company": bullet["company"],
-                        "position": bullet["position"],
-                        "section": bullet["section"],
-                        "experience_idx": bullet["experience_idx"],
-                        "bullet_idx": bullet["bullet_idx"],
-                        "similarity_score": similarity,
-                        "has_synonyms": len(keyword.get("synonyms", [])) > 0,
-                        "synonyms": keyword.get("synonyms", [])
-                    }
-                    
-                    similarity_results.append(result)
+            # Create result without embeddings
+            result = {
+                "keyword": keyword.keyword,
+                "keyword_context": keyword.context,
+                "relevance_score": keyword.relevance_score,
+                "skill_type": keyword.skill_type,
+                "bullet_text": bullet.bullet_text,
+                "company": bullet.company,
+                "position": bullet.position,
+                "section": bullet.section,
+                "experience_idx": bullet.experience_idx,
+                "bullet_idx": bullet.bullet_idx,
+                "similarity_score": float(similarity[keyword_idx, bullet_idx]),
+                "has_synonyms": len(keyword.synonyms) > 0,
+                "synonyms": keyword.synonyms
+            }
+            
+            similarity_results.append(result)
         
         # Sort by similarity score (descending)
         similarity_results.sort(key=lambda x: x["similarity_score"], reverse=True)
@@ -380,12 +698,16 @@ class SemanticMatcher:
         """
         matches_by_bullet = {}
         
+        # Lowercase each distinct bullet and keyword once rather than once per match
+        lowered_bullets = {text: text.lower() for text in {r["bullet_text"] for r in similarity_results}}
+        lowered_keywords = {kw: kw.lower() for kw in {r["keyword"] for r in similarity_results}}
+        
         for result in similarity_results:
             bullet_text = result["bullet_text"]
             
             # Check if keyword already in the bullet text
             keyword = result["keyword"]
-            if keyword.lower() in bullet_text.lower():
+            if lowered_keywords[keyword] in lowered_bullets[bullet_text]:
                 continue  # Skip if keyword already present
                 
             # Initialize if first match for this bullet
@@ -443,23 +765,24 @@ class SemanticMatcher:
         filtered_matches = {}
         
         # Process bullets in order of match quality (best matches first)
-        bullet_quality = []
-        for bullet, matches in matches_by_bullet.items():
-            # Score based on average relevance and similarity
-            if matches:
-                avg_relevance = sum(m["relevance_score"] for m in matches) / len(matches)
-                avg_similarity = sum(m["similarity_score"] for m in matches) / len(matches)
-                quality_score = avg_relevance * 0.7 + avg_similarity * 0.3
-            else:
-                quality_score = 0
-                
-            bullet_quality.append((bullet, quality_score))
+        bullets = list(matches_by_bullet)
+        counts = np.array([len(matches_by_bullet[bullet]) for bullet in bullets], dtype=np.int64)
+        all_matches = [m for bullet in bullets for m in matches_by_bullet[bullet]]
+        owner = np.repeat(np.arange(len(bullets)), counts)
+        relevance = np.array([m["relevance_score"] for m in all_matches], dtype=np.float64)
+        similarity = np.array([m["similarity_score"] for m in all_matches], dtype=np.float64)
         
-        # Sort bullets by quality score
-        bullet_quality.sort(key=lambda x: x[1], reverse=True)
+        # Score based on average relevance and similarity (bullets without matches score 0)
+        safe_counts = np.maximum(counts, 1)
+        avg_relevance = np.bincount(owner, weights=relevance, minlength=len(bullets)) / safe_counts
+        avg_similarity = np.bincount(owner, weights=similarity, minlength=len(bullets)) / safe_counts
+        quality_scores = avg_relevance * 0.7 + avg_similarity * 0.3
+        
+        # Sort bullets by quality score; stable so ties keep their original order
+        order = np.argsort(-quality_scores, kind="stable")
         
         # Process bullets in order
-        for bullet, _ in bullet_quality:
+        for bullet in (bullets[i] for i in order):
             if bullet in processed_bullets:
                 continue
                 
@@ -496,7 +819,8 @@ class SemanticMatcher:
             Dict[str, Dict[str, Any]]: 
                 { 
                     "CategoryName": {
-                        "skills": [{"skill": "SkillName", "embedding": [...]}, ...],
+                        "skills": [{"skill": "SkillName"}, ...],
+                        "embeddings": np.ndarray (one normalized row per skill),
                         "is_original": True 
                     }, ...
                 }
@@ -510,50 +834,70 @@ class SemanticMatcher:
 
         technical_skills_data = skills_section.get("Technical Skills", []) # Default to empty list
 
-        structured_skills = {}
+        skills_by_category: Dict[str, List[str]] = {}
 
         if isinstance(technical_skills_data, dict): # Skills are already categorized
             logger.debug("Resume technical skills appear to be categorized.")
             for category, skills_in_category in technical_skills_data.items():
                 if isinstance(skills_in_category, list):
-                    embedded_skills = []
+                    valid_skills = []
                     for skill_name in skills_in_category:
                         if isinstance(skill_name, str) and skill_name.strip():
-                            try:
-                                embedding = self._get_embedding(skill_name)
-                                embedded_skills.append({"skill": skill_name.strip(), "embedding": embedding})
-                            except Exception as e:
-                                logger.error(f"Failed to generate embedding for resume skill '{skill_name}' in category '{category}': {e}")
+                            valid_skills.append(skill_name)
                         else:
                             logger.warning(f"Invalid skill item '{skill_name}' in category '{category}', skipping.")
-                    if embedded_skills:
-                         structured_skills[category] = {"skills": embedded_skills, "is_original": True}
+                    skills_by_category[category] = valid_skills
                 else:
                     logger.warning(f"Category '{category}' in Technical Skills does not contain a list of skills, skipping.")
         elif isinstance(technical_skills_data, list): # Skills are a flat list
             logger.debug("Resume technical skills appear to be a flat list. Using default category.")
-            embedded_skills = []
+            valid_skills = []
             for skill_name in technical_skills_data:
                 if isinstance(skill_name, str) and skill_name.strip():
-                    try:
-                        embedding = self._get_embedding(skill_name)
-                        embedded_skills.append({"skill": skill_name.strip(), "embedding": embedding})
-                    except Exception as e:
-                        logger.error(f"Failed to generate embedding for resume skill '{skill_name}' (flat list): {e}")
+                    valid_skills.append(skill_name)
                 else:
                      logger.warning(f"Invalid skill item '{skill_name}' in flat list of technical skills, skipping.")
-            if embedded_skills:
-                structured_skills["_DEFAULT_TECHNICAL_SKILLS_"] = {"skills": embedded_skills, "is_original": True}
+            skills_by_category["_DEFAULT_TECHNICAL_SKILLS_"] = valid_skills
         else:
             logger.warning(f"'Technical Skills' data is not a recognized dict or list: {type(technical_skills_data)}. No skills extracted.")
 
+        structured_skills = self._embed_skill_categories(skills_by_category)
+
         total_extracted = sum(len(cat_data['skills']) for cat_data in structured_skills.values())
         logger.info(f"Extracted and embedded {total_extracted} technical skills from {len(structured_skills)} resume categories.")
         return structured_skills
 
-    def _categorize_jd_skills_with_openai(self, jd_hard_skills: List[Dict[str, Any]], resume_categories: List[str]) -> List[Dict[str, Any]]:
+    def _embed_skill_categories(self, skills_by_category: Dict[str, List[str]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Embed resume skill names for all categories in one batch pass.
+        
+        Returns:
+            dict: Category -> {"skills": [...], "embeddings": matrix, "is_original": True};
+                  categories where nothing was embedded are left out
+        """
+        all_embeddings = self._get_embeddings_batch(
+            [skill_name for skill_names in skills_by_category.values() for skill_name in skill_names]
+        )
+        structured_skills = {}
+        offset = 0
+        for category, skill_names in skills_by_category.items():
+            embeddings = all_embeddings[offset:offset + len(skill_names)]
+            offset += len(skill_names)
+            embedded = [i for i, embedding in enumerate(embeddings) if embedding is not None]
+            if embedded:
+                structured_skills[category] = {
+                    "skills": [{"skill": skill_names[i].strip()} for i in embedded],
+                    "embeddings": _stack_embeddings([embeddings[i] for i in embedded]),
+                    "is_original": True,
+                }
+        return structured_skills
+
+    def _categorize_jd_skills_with_openai(self, jd_hard_skills: List[KeywordRec], resume_categories: List[str], batch_size: int = 10, max_inflight: int = 8) -> List[KeywordRec]:
         """
         Categorizes JD hard skills using OpenAI based on existing resume skill categories.
+        
+        Skills are sent batch_size at a time, so N skills take about N / batch_size requests,
+        with up to max_inflight requests running concurrently.
         """
         logger.debug(f"Categorizing {len(jd_hard_skills)} JD hard skills using OpenAI. Resume categories: {resume_categories}")
         categorized_skills = []
@@ -561,63 +905,128 @@ class SemanticMatcher:
         if not resume_categories: # No categories to map to, assign a default new category
             logger.warning("No existing resume skill categories provided for mapping JD skills. Assigning all to a default new category.")
             for skill_data in jd_hard_skills:
-                skill_data_copy = skill_data.copy()
-                skill_data_copy["assigned_category"] = "New Skills" # Default new category
-                categorized_skills.append(skill_data_copy)
+                categorized_skills.append(dataclasses.replace(skill_data, assigned_category="New Skills")) # Default new category
             return categorized_skills
 
-        for skill_data in jd_hard_skills:
-            skill_name = skill_data["keyword"]
-            skill_context = skill_data.get("context", "N/A")
-            
-            prompt = (
-                f"Given the skill '{skill_name}' (context from job description: '{skill_context}') "
-                f"and the existing resume skill categories: {json.dumps(resume_categories)}.\n"
-                f"Which of these categories does the skill best fit into? "
-                f"If it doesn't fit well into any existing category, suggest 'New Category: [Appropriate New Category Name]' (e.g., 'New Category: Cloud Technologies'). "
-                f"If it fits an existing category, just return that category name. "
-                f"Be concise. Only return the category name or 'New Category: ...'."
-            )
-            
-            try:
-                response = self.client.chat.completions.create(
-                    model=self.generation_model,
-                    messages=[
-                        {"role": "system", "content": "You are an expert in categorizing technical skills."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    temperature=0.2,
-                    max_tokens=50
-                )
-                category_response = response.choices[0].message.content.strip()
-                logger.debug(f"OpenAI category response for '{skill_name}': '{category_response}'")
-
-                assigned_category = category_response
-                if category_response.startswith("New Category:"):
-                    assigned_category = category_response.replace("New Category:", "").strip()
-                    if not assigned_category: # Handle empty new category name
-                        assigned_category = f"New - {skill_name}" # Default if AI gives empty new cat name
-                elif category_response not in resume_categories: # If AI hallucinates a category not in the list and not 'New Category:'
-                    logger.warning(f"OpenAI suggested category '{category_response}' for skill '{skill_name}' which is not in existing resume categories or a 'New Category' format. Treating as a new category: '{category_response}'.")
-                    # Decide if we want to force it into an existing one, or accept it as new. For now, accept.
-                    # To be stricter, we might map it to the most similar existing one or a generic "Other New Skills"
-
-                skill_data_copy = skill_data.copy()
-                skill_data_copy["assigned_category"] = assigned_category
-                categorized_skills.append(skill_data_copy)
-
-            except Exception as e:
-                logger.error(f"Error categorizing skill '{skill_name}' with OpenAI: {e}. Assigning to default 'Uncategorized'.")
-                skill_data_copy = skill_data.copy()
-                skill_data_copy["assigned_category"] = "Uncategorized JD Skills"
-                categorized_skills.append(skill_data_copy)
+        # Serialized once and shared by every prompt
+        categories_json = json.dumps(resume_categories)
+        
+        # Several skills per prompt; the model also sees related skills together
+        batches = [jd_hard_skills[start:start + batch_size] for start in range(0, len(jd_hard_skills), batch_size)]
+        if len(batches) <= 1:
+            batch_results = [self._categorize_skill_batch(batch, resume_categories, categories_json) for batch in batches]
+        else:
+            # Bounded concurrency keeps us within the account's rate limits; map preserves order
+            with ThreadPoolExecutor(max_workers=min(max_inflight, len(batches))) as executor:
+                batch_results = list(executor.map(lambda batch: self._categorize_skill_batch(batch, resume_categories, categories_json), batches))
+        for batch_result in batch_results:
+            categorized_skills.extend(batch_result)
         
         logger.info(f"Categorized {len(categorized_skills)} JD hard skills using OpenAI.")
         return categorized_skills
 
+    def _categorize_skill_batch(self, batch: List[KeywordRec], resume_categories: List[str], categories_json: str) -> List[KeywordRec]:
+        """
+        Categorize a batch of JD skills with a single JSON-mode request.
+        
+        Skills missing from the response, or the whole batch if the response
+        cannot be parsed, fall back to one prompt per skill.
+        """
+        items = [{"skill": skill_data.keyword, "context": skill_data.context or "N/A"} for skill_data in batch]
+        prompt = (
+            f"Existing resume skill categories: {categories_json}.\n"
+            f"For each skill below (with context from the job description), choose the existing category it best fits into. "
+            f"If it doesn't fit well into any existing category, use 'New Category: [Appropriate New Category Name]' (e.g., 'New Category: Cloud Technologies').\n"
+            f"Skills: {json.dumps(items)}\n"
+            f'Respond with a JSON object of the form {{"categories": [{{"skill": "...", "category": "..."}}, ...]}}, '
+            f"with one entry per skill, using the skill names exactly as given."
+        )
+        
+        try:
+            response = self.client.chat.completions.create(
+                model=self.generation_model,
+                messages=[
+                    _CATEGORIZATION_SYSTEM_MESSAGE,
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.2,
+                max_tokens=40 * len(batch) + 50,
+                response_format={"type": "json_object"}
+            )
+            content = response.choices[0].message.content
+            logger.debug(f"OpenAI batch category response: '{content}'")
+            assigned = {
+                entry["skill"]: str(entry["category"]).strip()
+                for entry in json.loads(content)["categories"]
+                if isinstance(entry, dict) and entry.get("skill") and entry.get("category")
+            }
+        except Exception as e:
+            logger.warning(f"Batch categorization of {len(batch)} skills failed: {e}. Falling back to one request per skill.")
+            assigned = {}
+        
+        categorized_skills = []
+        for skill_data in batch:
+            category_response = assigned.get(skill_data.keyword)
+            if category_response:
+                categorized_skills.append(self._apply_category(skill_data, category_response, resume_categories))
+            else:
+                categorized_skills.append(self._categorize_single_skill(skill_data, resume_categories, categories_json))
+        return categorized_skills
+
+    def _categorize_single_skill(self, skill_data: KeywordRec, resume_categories: List[str], categories_json: str) -> KeywordRec:
+        """
+        Categorize one JD skill with its own prompt.
+        """
+        skill_name = skill_data.keyword
+        skill_context = skill_data.context or "N/A"
+        
+        prompt = (
+            f"Given the skill '{skill_name}' (context from job description: '{skill_context}') "
+            f"and the existing resume skill categories: {categories_json}.\n"
+            f"Which of these categories does the skill best fit into? "
+            f"If it doesn't fit well into any existing category, suggest 'New Category: [Appropriate New Category Name]' (e.g., 'New Category: Cloud Technologies'). "
+            f"If it fits an existing category, just return that category name. "
+            f"Be concise. Only return the category name or 'New Category: ...'."
+        )
+        
+        try:
+            response = self.client.chat.completions.create(
+                model=self.generation_model,
+                messages=[
+                    _CATEGORIZATION_SYSTEM_MESSAGE,
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.2,
+                max_tokens=50
+            )
+            category_response = response.choices[0].message.content.strip()
+            logger.debug(f"OpenAI category response for '{skill_name}': '{category_response}'")
+            return self._apply_category(skill_data, category_response, resume_categories)
+
+        except Exception as e:
+            logger.error(f"Error categorizing skill '{skill_name}' with OpenAI: {e}. Assigning to default 'Uncategorized'.")
+            return dataclasses.replace(skill_data, assigned_category="Uncategorized JD Skills")
+
+    def _apply_category(self, skill_data: KeywordRec, category_response: str, resume_categories: List[str]) -> KeywordRec:
+        """
+        Return a copy of skill_data with the model's category answer normalized into assigned_category.
+        """
+        skill_name = skill_data.keyword
+        assigned_category = category_response
+        if category_response.startswith("New Category:"):
+            assigned_category = category_response.replace("New Category:", "").strip()
+            if not assigned_category: # Handle empty new category name
+                assigned_category = f"New - {skill_name}" # Default if AI gives empty new cat name
+        elif category_response not in resume_categories: # If AI hallucinates a category not in the list and not 'New Category:'
+            logger.warning(f"OpenAI suggested category '{category_response}' for skill '{skill_name}' which is not in existing resume categories or a 'New Category' format. Treating as a new category: '{category_response}'.")
+            # Decide if we want to force it into an existing one, or accept it as new. For now, accept.
+            # To be stricter, we might map it to the most similar existing one or a generic "Other New Skills"
+
+        return dataclasses.replace(skill_data, assigned_category=assigned_category)
+
     def select_final_technical_skills(self,
                                      resume_skills_structured: Dict[str, Dict[str, Any]],
-                                     categorized_jd_hard_skills: List[Dict[str, Any]],
+                                     categorized_jd_hard_skills: List[KeywordRec],
                                      overall_skill_limit: int = 15) -> Tuple[Dict[str, List[str]], Dict[str, Any]]:
         """
         Selects the final list of technical skills, combining resume and JD skills,
@@ -637,92 +1046,70 @@ class SemanticMatcher:
         }
         
         # 1. Consolidate skills by category
-        consolidated_skills = {} # category_name -> list of skill_dicts {'skill': str, 'embedding': [], 'relevance': float, 'is_original': bool, 'jd_context': str/None}
+        consolidated_skills: Dict[str, SkillBlock] = {}
         
         # Add resume skills
         for category, data in resume_skills_structured.items():
-            if category not in consolidated_skills:
-                consolidated_skills[category] = []
-            for skill_info in data.get('skills', []):
-                consolidated_skills[category].append({
-                    "skill": skill_info["skill"],
-                    "embedding": skill_info["embedding"],
-                    "relevance": 1.0, # Original skills get high relevance
-                    "is_original": True,
-                    "jd_context": None
-                })
+            names = [skill_info["skill"] for skill_info in data.get('skills', [])]
+            consolidated_skills[category] = SkillBlock(
+                names=names,
+                embeddings=data["embeddings"],
+                relevance=np.ones(len(names)), # Original skills get high relevance
+                is_original=np.ones(len(names), dtype=bool),
+                jd_context=[None] * len(names),
+            )
 
         # Add categorized JD skills
+        jd_skills_by_category: Dict[str, List[KeywordRec]] = {}
         for jd_skill_info in categorized_jd_hard_skills:
-            category = jd_skill_info.get("assigned_category", "Uncategorized JD Skills")
-            if category not in consolidated_skills:
-                consolidated_skills[category] = []
-            consolidated_skills[category].append({
-                "skill": jd_skill_info["keyword"],
-                "embedding": jd_skill_info["embedding"],
-                "relevance": jd_skill_info.get("relevance_score", 0.5),
-                "is_original": False,
-                "jd_context": jd_skill_info.get("context")
-            })
+            category = jd_skill_info.assigned_category or "Uncategorized JD Skills"
+            jd_skills_by_category.setdefault(category, []).append(jd_skill_info)
+        for category, jd_skills in jd_skills_by_category.items():
+            jd_block = SkillBlock(
+                names=[jd_skill.keyword for jd_skill in jd_skills],
+                embeddings=np.vstack([jd_skill.embedding for jd_skill in jd_skills]),
+                relevance=np.array([jd_skill.relevance_score for jd_skill in jd_skills], dtype=np.float64),
+                is_original=np.zeros(len(jd_skills), dtype=bool),
+                jd_context=[jd_skill.context for jd_skill in jd_skills],
+            )
+            if category in consolidated_skills:
+                consolidated_skills[category] = consolidated_skills[category].extend(jd_block)
+            else:
+                consolidated_skills[category] = jd_block
         
         logger.debug(f"Consolidated skills by category: { {cat: len(sks) for cat, sks in consolidated_skills.items()} }")
 
-        # 2. Deduplicate within each category
-        for category, skills_list in consolidated_skills.items():
-            deduplicated_for_category = []
-            processed_indices = set()
-            for i, s1 in enumerate(skills_list):
-                if i in processed_indices:
-                    continue
-                current_best_skill = s1
-                duplicates_found = []
-                for j in range(i + 1, len(skills_list)):
-                    if j in processed_indices:
-                        continue
-                    s2 = skills_list[j]
-                    # Check text similarity (case-insensitive, strip spaces)
-                    s1_norm = s1["skill"].strip().lower()
-                    s2_norm = s2["skill"].strip().lower()
-                    if s1_norm == s2_norm or self._cosine_similarity(s1["embedding"], s2["embedding"]) > self.skill_similarity_threshold :
-                        duplicates_found.append(s2)
-                        processed_indices.add(j)
-                        # Prefer original, then higher relevance for duplicates
-                        if s2["is_original"] and not current_best_skill["is_original"]:
-                            current_best_skill = s2
-                        elif s2["relevance"] > current_best_skill["relevance"] and not current_best_skill["is_original"]:
-                             current_best_skill = s2
-                        # if both original, or both not, keep the one with higher relevance
-                        elif s2["is_original"] == current_best_skill["is_original"] and s2["relevance"] > current_best_skill["relevance"]:
-                            current_best_skill = s2
-
-
-                deduplicated_for_category.append(current_best_skill)
-                if duplicates_found:
+        # 2. Deduplicate within each category: duplicates are merged transitively
+        # (A~B and B~C puts all three together), keeping the original skill with
+        # the highest relevance, else the JD skill with the highest relevance
+        for category, block in consolidated_skills.items():
+            duplicate_pairs = np.argwhere(np.triu(self._skill_duplicate_mask(block), k=1))
+            kept_indices = []
+            for group in _connected_groups(len(block), duplicate_pairs.tolist()):
+                group = np.asarray(group)
+                best = int(group[np.lexsort((-block.relevance[group], ~block.is_original[group]))[0]])
+                kept_indices.append(best)
+                if len(group) > 1:
                     log_details["deduplication_info"].append({
                         "category": category,
-                        "kept": current_best_skill["skill"],
-                        "discarded_duplicates": [d["skill"] for d in duplicates_found]
+                        "kept": block.names[best],
+                        "discarded_duplicates": [block.names[d] for d in group if d != best]
                     })
-            consolidated_skills[category] = deduplicated_for_category
+            consolidated_skills[category] = block.take(kept_indices)
         
         logger.debug(f"Skills after deduplication: { {cat: len(sks) for cat, sks in consolidated_skills.items()} }")
-        # Storing the objects post-deduplication for logging if needed, but log_details["deduplication_info"] captures changes.
-        # log_details["deduplication_log"] = copy.deepcopy(consolidated_skills) # Be careful with deepcopy if embeddings are large
 
         log_details["category_skill_counts_before_limit"] = {cat: len(sks) for cat, sks in consolidated_skills.items()}
 
-        # 2. Sort skills within each category (prioritize original, then relevance)
-        for category in consolidated_skills:
-            consolidated_skills[category].sort(key=lambda x: (x['is_original'], x['relevance']), reverse=True)
+        # 2. Sort skills within each category (prioritize original, then relevance; stable for ties)
+        for category, block in consolidated_skills.items():
+            consolidated_skills[category] = block.take(np.lexsort((-block.relevance, ~block.is_original)))
 
         # 3. Round-robin selection to fill final skills
         final_skills_by_category_dict = {} # Dict[str, List[str]]
         selected_skill_names_globally = set()
         current_total_skills = 0
         
-        # Pointers for iterating through each category's sorted skill list
-        skill_pointers = {category: 0 for category in consolidated_skills}
-        
         # Determine category processing order (original categories first, then new ones alphabetically)
         original_category_keys = set(resume_skills_structured.keys()) # Use set for faster lookups
         
@@ -734,37 +1121,37 @@ class SemanticMatcher:
         )
         log_details["category_processing_order"] = all_category_keys_ordered
         
-        # Round-robin selection loop
-        while current_total_skills < overall_skill_limit:
+        # Lowercase every name once; the original spelling is only looked up for skills that are kept
+        ordered_names = [consolidated_skills[category].names for category in all_category_keys_ordered]
+        lowered_names = [[name.lower() for name in names] for names in ordered_names]
+        
+        # Round-robin selection loop: round r offers the r-th best skill of every
+        # category still holding one, in processing order
+        live_categories = list(zip(all_category_keys_ordered, ordered_names, lowered_names))
+        round_index = 0
+        while live_categories and current_total_skills < overall_skill_limit:
+            # Exhausted categories are dropped for good, so later rounds never revisit them
+            live_categories = [entry for entry in live_categories if round_index < len(entry[1])]
             skill_added_this_round = False
-            for category_name in all_category_keys_ordered:
-                if category_name not in consolidated_skills: # Should not happen if all_category_keys_ordered from consolidated_skills
+            for category_name, names, lowered in live_categories:
+                if current_total_skills >= overall_skill_limit:
+                    break # Finished filling overall limit
+                skill_lc = lowered[round_index]
+                if skill_lc in selected_skill_names_globally:
                     continue
 
-                skills_in_this_category = consolidated_skills[category_name]
-                current_pointer = skill_pointers.get(category_name, 0)
-
-                if current_pointer < len(skills_in_this_category):
-                    skill_to_add = skills_in_this_category[current_pointer]
-                    skill_name = skill_to_add["skill"]
-
-                    if skill_name.lower() not in selected_skill_names_globally:
-                        if category_name not in final_skills_by_category_dict:
-                            final_skills_by_category_dict[category_name] = []
-                        
-                        final_skills_by_category_dict[category_name].append(skill_name)
-                        selected_skill_names_globally.add(skill_name.lower())
-                        current_total_skills += 1
-                        skill_added_this_round = True
-                    
-                    skill_pointers[category_name] = current_pointer + 1 # Advance pointer regardless of global duplicate
-                    
-                    if current_total_skills >= overall_skill_limit:
-                        break # Break from inner category loop (finished filling overall limit)
+                if category_name not in final_skills_by_category_dict:
+                    final_skills_by_category_dict[category_name] = []
+                
+                final_skills_by_category_dict[category_name].append(names[round_index])
+                selected_skill_names_globally.add(skill_lc)
+                current_total_skills += 1
+                skill_added_this_round = True
             
-            if not skill_added_this_round or current_total_skills >= overall_skill_limit:
-                # Break from outer while loop if no skills were added in a full round, or if limit is met
+            if not skill_added_this_round:
+                # Stop if no skills were added in a full round
                 break
+            round_index += 1
         
         log_details["final_skill_counts_by_category"] = {cat: len(sks) for cat, sks in final_skills_by_category_dict.items()}
         
@@ -776,50 +1163,141 @@ class SemanticMatcher:
         
         return final_skills_by_category_dict, log_details
 
-    def _get_embedding(self, text: str) -> List[float]:
+    def _skill_duplicate_mask(self, block: SkillBlock) -> np.ndarray:
+        """
+        Boolean matrix marking pairs of skills that are duplicates of each other.
+        
+        Two skills are duplicates when their names match case-insensitively (ignoring
+        surrounding spaces) or their embeddings are more similar than skill_similarity_threshold.
+        """
+        if not len(block):
+            return np.zeros((0, 0), dtype=bool)
+        # Normalize each name once and group exact matches by hashing, so the
+        # pairwise comparison below is on small integers rather than strings
+        name_groups: Dict[str, int] = {}
+        name_labels = np.array([name_groups.setdefault(name.strip().lower(), len(name_groups)) for name in block.names])
+        # Exact matches are already settled, so only the first skill of each name is embedded-compared
+        _, representatives = np.unique(name_labels, return_index=True)
+        representative_embeddings = block.embeddings[representatives]
+        similar = _cosine_matrix(representative_embeddings, representative_embeddings) > self.skill_similarity_threshold
+        return (name_labels[:, None] == name_labels[None, :]) | similar[np.ix_(name_labels, name_labels)]
+    
+    def _get_embedding(self, text: str, deadline: Optional[float] = None) -> np.ndarray:
         """
         Get embedding for text using OpenAI API.
         
         Args:
             text: Text to get embedding for
+            deadline: time.monotonic() value after which retries stop
             
         Returns:
-            list: Embedding vector
+            np.ndarray: L2-normalized float32 embedding vector
         """
-        response = self.client.embeddings.create(
-            input=text,
-            model=self.model
-        )
-        return response.data[0].embedding
+        response = self._create_embeddings(text, deadline)
+        return _normalize_vector(response.data[0].embedding)
     
-    def _cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
+    def _create_embeddings(self, embedding_input, deadline: Optional[float] = None):
         """
-        Calculate cosine similarity between two vectors.
+        Call the embeddings API, retrying rate limits, server errors and timeouts.
+        
+        The error is raised once EMBEDDING_MAX_ATTEMPTS attempts have failed or
+        the next wait would pass deadline (EMBEDDING_RETRY_DEADLINE from now by default).
+        """
+        if deadline is None:
+            deadline = time.monotonic() + EMBEDDING_RETRY_DEADLINE
+        for attempt in range(1, EMBEDDING_MAX_ATTEMPTS + 1):
+            try:
+                return self.client.embeddings.create(
+                    input=embedding_input,
+                    model=self.model
+                )
+            except _RETRYABLE_EMBEDDING_ERRORS as e:
+                delay = _retry_delay(e, attempt)
+                if attempt == EMBEDDING_MAX_ATTEMPTS or time.monotonic() + delay > deadline:
+                    raise
+                logger.warning(f"Embedding request failed ({type(e).__name__}), retrying in {delay:.1f}s (attempt {attempt}/{EMBEDDING_MAX_ATTEMPTS})")
+                time.sleep(delay)
+    
+    def _get_embeddings_batch(self, texts: List[str], batch_size: int = 256, max_inflight: int = 5) -> List[Optional[np.ndarray]]:
+        """
+        Get embeddings for many texts using one API request per batch.
+        
+        Repeated texts are embedded once. Texts already in the embedding cache
+        are served from it; the rest are sorted by length, split into
+        batches and dispatched concurrently (at most max_inflight batches at a
+        time) over the client's pooled keep-alive connections and then cached.
         
         Args:
-            vec1: First vector
-            vec2: Second vector
+            texts: Texts to get embeddings for
+            batch_size: Maximum number of texts sent per request
+            max_inflight: Maximum number of concurrent batch requests
             
         Returns:
-            float: Cosine similarity (0-1)
+            list: L2-normalized float32 embedding vectors in input order (None where the API
+                rejected the text or transient errors outlasted EMBEDDING_RETRY_DEADLINE)
+        
+        Raises:
+            openai.OpenAIError: On errors that retrying cannot fix, such as authentication failures
         """
-        # Convert to numpy arrays
-        v1 = np.array(vec1)
-        v2 = np.array(vec2)
+        keys = [EmbeddingCache.make_key(self.model, text) for text in texts]
         
-        # Calculate dot product
-        dot_product = np.dot(v1, v2)
+        # Each distinct text is looked up and embedded once, however often it repeats
+        unique_texts = dict(zip(keys, texts))
+        vectors = self.embedding_cache.get_many(list(unique_texts))
+        missing = [key for key in unique_texts if key not in vectors]
+        self.cache_hits += len(unique_texts) - len(missing)
+        self.cache_misses += len(missing)
         
-        # Calculate magnitudes
-        mag1 = np.linalg.norm(v1)
-        mag2 = np.linalg.norm(v2)
+        # Batch texts of similar length together, so requests carry similar amounts of text
+        missing.sort(key=lambda key: len(unique_texts[key]))
+        missing_texts = [unique_texts[key] for key in missing]
+        chunks = [missing_texts[start:start + batch_size] for start in range(0, len(missing_texts), batch_size)]
+        embed_chunk = functools.partial(self._embed_chunk, deadline=time.monotonic() + EMBEDDING_RETRY_DEADLINE)
+        if len(chunks) <= 1:
+            chunk_results = [embed_chunk(chunk) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_inflight, len(chunks))) as executor:
+                chunk_results = list(executor.map(embed_chunk, chunks))
         
-        # Avoid division by zero
-        if mag1 == 0 or mag2 == 0:
-            return 0
-            
-        # Calculate cosine similarity
-        return dot_product / (mag1 * mag2)
+        fetched = {}
+        fetched_embeddings = (embedding for chunk_result in chunk_results for embedding in chunk_result)
+        for key, embedding in zip(missing, fetched_embeddings):
+            if embedding is not None:
+                fetched[key] = embedding
+        # Use the cached form of new vectors too, so a similarity score does not
+        # depend on whether its inputs were fetched now or served from the cache
+        vectors.update(self.embedding_cache.set_many(fetched))
+        
+        embeddings: List[Optional[np.ndarray]] = [vectors.get(key) for key in keys]
+        return embeddings
+    
+    def _embed_chunk(self, chunk: List[str], deadline: float) -> List[Optional[np.ndarray]]:
+        """
+        Embed one batch of texts in a single request.
+        
+        If the API rejects the batch as invalid, the texts are sent one at a
+        time with _get_embedding so a single bad input does not drop the whole
+        batch. Texts whose transient errors outlast the retries come back as
+        None, like rejected ones; other errors are raised.
+        """
+        try:
+            response = self._create_embeddings(chunk, deadline)
+            return [_normalize_vector(d.embedding) for d in response.data]
+        except openai.BadRequestError as e:
+            logger.error(f"Batch embedding request for {len(chunk)} texts was rejected: {str(e)}. Retrying individually.")
+        except _RETRYABLE_EMBEDDING_ERRORS as e:
+            # Already retried until the deadline; sending the texts one by one would only wait longer
+            logger.error(f"Batch embedding request for {len(chunk)} texts still failing after retries: {str(e)}. Skipping these texts.")
+            return [None] * len(chunk)
+        
+        embeddings: List[Optional[np.ndarray]] = []
+        for text in chunk:
+            try:
+                embeddings.append(self._get_embedding(text, deadline))
+            except (openai.BadRequestError, *_RETRYABLE_EMBEDDING_ERRORS) as e_single:
+                logger.error(f"Error generating embedding for '{text[:30]}...': {str(e_single)}")
+                embeddings.append(None)
+        return embeddings
     
     def save_results_to_file(self, results: Dict[str, Any], output_path: str) -> None:
         """
@@ -839,8 +1317,18 @@ class SemanticMatcher:
             "skill_selection_process_log": results.get("skill_selection_process_log")
         }
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(clean_results, f, indent=2)
+        payload = None
+        if orjson is not None:
+            try:
+                payload = orjson.dumps(clean_results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+            except TypeError:
+                # Types orjson rejects go through json
+                pass
+        if payload is None:
+            payload = json.dumps(clean_results, indent=2).encode('utf-8')
+        
+        with open(output_path, 'wb') as f:
+            f.write(payload)
             
         logger.info(f"Results saved to {output_path}")
     
@@ -852,8 +1340,13 @@ class SemanticMatcher:
             similarity_results: Similarity results
             output_path: Path to save CSV to
         """
-        df = pd.DataFrame(similarity_results)
-        df.to_csv(output_path, index=False)
+        # Columns in first-seen order across all rows; missing values are left empty
+        fieldnames = list(dict.fromkeys(key for row in similarity_results for key in row))
+        with open(output_path, 'w', newline='', encoding='utf-8') as f:
+            if fieldnames:
+                writer = csv.DictWriter(f, fieldnames=fieldnames, restval="", lineterminator="\n")
+                writer.writeheader()
+                writer.writerows(similarity_results)
         logger.info(f"Similarity results exported to {output_path}")
 
 
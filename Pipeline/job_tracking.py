@@ -1,6 +1,10 @@
 
 
+import atexit
 import logging
+import queue
+import threading
+import time
 import uuid
 
 from supabase import Client
@@ -14,8 +18,55 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 db = get_db()
 
-def create_optimization_job(resume_id, user_id, job_description):
+# Job status updates are written by a background thread so the pipeline never
+# waits on the database. A single writer keeps each job's updates in order, and
+# everything queued for the same job is merged into one write. The job row
+# itself is inserted synchronously, so a returned job ID always has a row.
+_write_queue = queue.Queue()
+# Longest time flush() (and so interpreter exit) waits for queued writes
+FLUSH_TIMEOUT = 10.0
+
+
+def _write_job_update(job_id, data: dict):
+    response = db.table('optimization_jobs')\
+        .update(data).eq("id", job_id).execute()
+    
+    if not (hasattr(response, "data") and response.data):
+        error_text = getattr(response, "error", "Unknown error")
+        logger.warning(
+            f"Error updating optimization job: {error_text}",
+            exc_info=True,
+        )
+
+
+def _write_worker():
+    while True:
+        batch = [_write_queue.get()]
+        while True:
+            try:
+                batch.append(_write_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        # job_id -> merged fields; later fields win
+        pending = {}
+        for job_id, data in batch:
+            pending.setdefault(job_id, {}).update(data)
 
+        for job_id, data in pending.items():
+            try:
+                _write_job_update(job_id, data)
+            except Exception as e:
+                logger.error(f"Failed to write optimization job {job_id}: {e}", exc_info=True)
+        for _ in batch:
+            _write_queue.task_done()
+
+
+threading.Thread(target=_write_worker, name="job-tracking-writer", daemon=True).start()
+
+
+def create_optimization_job(resume_id, user_id, job_description):
+    """Insert the job row and return its ID, or None if it could not be created."""
     logger.info("Creating job tracking at the database")
     job_id = uuid.uuid4().hex   
     response = db.table("optimization_jobs").insert({
@@ -40,18 +91,36 @@ def create_optimization_job(resume_id, user_id, job_description):
 
 
 def update_optimization_job(job_id, data:dict):
+    """Queue a status update for job_id; it is written in the background."""
     if not job_id:
         return
     
-    response = db.table('optimization_jobs')\
-        .update(data).eq("id", job_id).execute()
-    
-    if not (hasattr(response, "data") and response.data):
-        error_text = getattr(response, "error", "Unknown error")
-        logger.warning(
-            f"Error updating optimization job: {error_text}",
-            exc_info=True,
-        )
+    _write_queue.put((job_id, dict(data)))
+
+
+def flush(timeout=FLUSH_TIMEOUT):
+    """
+    Wait up to timeout seconds for every queued job update to be written.
+
+    Returns False, logging how many writes are dropped, if the writer has not
+    caught up in time (for example because the database is down), so that
+    process exit is never blocked indefinitely.
+    """
+    deadline = time.monotonic() + timeout
+    with _write_queue.all_tasks_done:
+        while _write_queue.unfinished_tasks:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.warning(
+                    f"Gave up waiting for {_write_queue.unfinished_tasks} optimization job update(s) after {timeout:.0f}s; they are dropped."
+                )
+                return False
+            _write_queue.all_tasks_done.wait(remaining)
+    return True
+
+
+# Don't lose queued writes when the process exits, but don't hang on them either
+atexit.register(flush)
 
 
 def post_optimization_job(job):
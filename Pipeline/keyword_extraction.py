@@ -1,10 +1,17 @@
 import json
 import logging
+import os
 import re
 from typing import Any, Dict
 
 from Services.openai_interface import call_openai_api
 
+# orjson parses the model response faster; optional, json is used when it is missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # Configure logging
 logging.basicConfig(
@@ -12,6 +19,38 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# JSON object wrapped in a ```json markdown block
+_MARKDOWN_JSON_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL | re.IGNORECASE)
+# Body of the "keywords" array, used when repairing malformed responses
+_LIST_CONTENT_RE = re.compile(r'"keywords"\s*:\s*\[(.*?)\]', re.DOTALL)
+
+_JSON_DECODER = json.JSONDecoder()
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# The prompt template is static; read it once and split around the JD placeholder
+with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "prompts", "extract_keywords.txt")) as file:
+    _EXTRACT_KEYWORDS_PREFIX, _, _EXTRACT_KEYWORDS_SUFFIX = file.read().partition("@job_description_text")
+
+
+def _iter_json_objects(text: str):
+    """
+    Yield every top-level JSON object embedded in text, in order.
+
+    Scans forward with JSONDecoder.raw_decode, so objects may be separated by
+    anything (missing commas, stray text); a '{' that does not start a valid
+    object is skipped. Runs in a single pass without regex backtracking.
+    """
+    pos = text.find("{")
+    while pos != -1:
+        try:
+            obj, end = _JSON_DECODER.raw_decode(text, pos)
+        except json.JSONDecodeError as e:
+            logger.warning(f"Could not parse potential object at offset {pos} during repair: {text[pos:pos + 100]}... Error: {e}")
+            pos = text.find("{", pos + 1)
+            continue
+        yield obj
+        pos = text.find("{", end)
 
 
 def extract_keywords(
@@ -36,8 +75,7 @@ def extract_keywords(
     """
     # NOTE: Using the original prompt structure, not the simplified one with markers.
     # Added instruction for failure case.
-    with open("Pipeline/prompts/extract_keywords.txt") as file:
-        user_prompt = file.read().replace("@job_description_txt", job_description_text)
+    user_prompt = _EXTRACT_KEYWORDS_PREFIX + job_description_text + _EXTRACT_KEYWORDS_SUFFIX
 
 
     # Log the input being sent (first 100 chars)
@@ -53,9 +91,7 @@ def extract_keywords(
 
     # Attempt to extract JSON block if present (e.g., within markdown)
     logger.info(f"Raw keyword extraction result from OpenAI (Passed initial '{'{'} check'): {raw_result[:500]}...")
-    json_match = re.search(
-        r"```(?:json)?\s*({.*?})\s*```", raw_result, re.DOTALL | re.IGNORECASE
-    )
+    json_match = _MARKDOWN_JSON_RE.search(raw_result)
     if not json_match:
         # Fallback: Check if the raw result itself is the JSON object (already validated startswith('{'))
         if raw_result_stripped.endswith('}'):
@@ -73,7 +109,7 @@ def extract_keywords(
 
     try:
         # Attempt to parse the extracted JSON string
-        parsed_data = json.loads(structured_data_str)
+        parsed_data = _json_loads(structured_data_str)
 
         # Validate the structure
         if (
@@ -99,7 +135,7 @@ def extract_keywords(
 
         # Try to extract content within the "keywords": [...] list first for focused search
         # This regex tries to find the list content, handling potential whitespace
-        list_content_match = re.search(r'"keywords"\s*:\s*\[(.*?)\]', structured_data_str, re.DOTALL)
+        list_content_match = _LIST_CONTENT_RE.search(structured_data_str)
         content_to_search = structured_data_str 
 
         if list_content_match:
@@ -108,35 +144,15 @@ def extract_keywords(
         else:
             logger.warning("Repair attempt: Could not find standard 'keywords': [...] structure, searching entire response string.")
 
-        # Regex to find potential JSON objects: starts with '{', ends with '}' non-greedily.
-        # It attempts to capture complete objects even if commas are missing between them.
-        # Matches { ... } pairs, being careful about nested braces might be complex,
-        # this simpler approach targets top-level objects assuming keywords aren't deeply nested.
-        object_pattern = re.compile(r'(\{.*?\})(?=\s*\{|\s*$|\s*,?\s*\])', re.DOTALL)
-
-        potential_objects = object_pattern.findall(content_to_search)
-        logger.info(f"Repair attempt: Found {len(potential_objects)} potential keyword objects using regex.")
-
-        for i, obj_str in enumerate(potential_objects):
-            obj_str = obj_str.strip()
-            if not obj_str: continue # Skip empty matches
-
-            try:
-                # Clean up potential trailing comma JUST IN CASE the regex included it accidentally
-                obj_str_cleaned = obj_str.rstrip(',')
-                keyword_obj = json.loads(obj_str_cleaned)
-
-                # Basic validation of the parsed object's structure
-                if isinstance(keyword_obj, dict) and all(k in keyword_obj for k in ["keyword", "context", "relevance_score", "skill_type"]):
-                    repaired_keywords.append(keyword_obj)
-                    # logger.debug(f"Repair successful for object {i+1}.") # Optional: too verbose?
-                else:
-                    logger.warning(f"Repaired object {i+1} lacks expected keys or is not dict: {obj_str_cleaned[:100]}...")
-
-            except json.JSONDecodeError as repair_e:
-                logger.warning(f"Could not parse potential object {i+1} during repair: {obj_str_cleaned[:100]}... Error: {repair_e}")
-            except Exception as general_repair_e:
-                 logger.warning(f"Unexpected error parsing potential object {i+1} during repair: {obj_str_cleaned[:100]}... Error: {general_repair_e}")
+        # Walk the candidate objects with the JSON decoder itself, which copes with
+        # missing commas between objects and never backtracks.
+        for i, keyword_obj in enumerate(_iter_json_objects(content_to_search)):
+            # Basic validation of the parsed object's structure
+            if isinstance(keyword_obj, dict) and all(k in keyword_obj for k in ["keyword", "context", "relevance_score", "skill_type"]):
+                repaired_keywords.append(keyword_obj)
+            else:
+                logger.warning(f"Repaired object {i+1} lacks expected keys or is not dict: {str(keyword_obj)[:100]}...")
+        logger.info(f"Repair attempt: Parsed {len(repaired_keywords)} valid keyword objects.")
 
         # Check if repair was successful
         if repaired_keywords:
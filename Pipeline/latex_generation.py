@@ -1,11 +1,17 @@
+import atexit
+import hashlib
 import json
 import os
+import re
 import subprocess
 import tempfile
+import threading
 import logging
+from bisect import bisect_left
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple
-import copy
 import shutil
 from werkzeug.utils import secure_filename
 
@@ -27,16 +33,156 @@ PROACTIVE_PDF_OUTPUT_FOLDER.mkdir(parents=True, exist_ok=True)
 DEFAULT_START_HEIGHT = 11.0  # Standard letter size
 DEFAULT_MIN_HEIGHT_INCHES = 11.0  # Default minimum page height (inches)
 MAX_HEIGHT_INCHES = 15.0  # Maximum page height (inches) before falling back to multi-page output
-MAX_ITERATIONS_PER_HEIGHT = 2 # Max recompilations for a given height if bibtex is needed.
+MAX_ITERATIONS_PER_HEIGHT = 2 # Max recompilations for a given height if cross-references need a second pass.
 HEIGHT_INCREMENT_INCHES = 0.5  # Increment for trying different page heights
+MAX_PARALLEL_PROBES = min(4, os.cpu_count() or 1)  # Draft compiles run side by side in each search round
+# Candidate heights, stepped in whole tenths of an inch so repeated float addition cannot drift
+_HEIGHTS = tuple(
+    tenths / 10
+    for tenths in range(round(DEFAULT_MIN_HEIGHT_INCHES * 10), round(MAX_HEIGHT_INCHES * 10) + 1, round(HEIGHT_INCREMENT_INCHES * 10))
+)
+
+# pdflatex is preferred, since the search relies on its draft mode and format
+# files; images that ship only tectonic use that instead. RESUME_LATEX_ENGINE
+# ("pdflatex" or "tectonic") forces either.
+LATEX_ENGINE = os.environ.get("RESUME_LATEX_ENGINE") or (
+    "tectonic" if shutil.which("pdflatex") is None and shutil.which("tectonic") else "pdflatex"
+)
+
+# Finished PDFs keyed by their inputs, so repeated requests for the same resume
+# skip LaTeX entirely. Off unless RESUME_PDF_CACHE_DIR is set, since the PDFs hold
+# personal data; the directory is kept private to the server's user (0700).
+PDF_CACHE_DIR = os.environ.get("RESUME_PDF_CACHE_DIR", "")
+PDF_CACHE_MAX_ENTRIES = 256
+_TEMPLATE_SOURCE_PATH = Path(os.path.dirname(os.path.abspath(__file__))) / "latex_resume" / "templates" / "resume_generator.py"
+
+# Shared by every request, so concurrent PDF generations together never run more
+# than MAX_PARALLEL_PROBES draft compiles at once
+_probe_executor = ThreadPoolExecutor(max_workers=MAX_PARALLEL_PROBES, thread_name_prefix="latex-probe")
+
+# Height prediction: text packed into full-width 11pt lines (7.7in text width,
+# 13.6pt baselines) below the 0.75in of vertical margins
+_MAX_CHARS_PER_LINE = 115
+_LINE_HEIGHT_INCHES = 13.6 / 72
+_VERTICAL_MARGIN_INCHES = 0.75
+
+# Only the geometry line depends on the page height, so the document is rendered
+# once per font size with this placeholder and the height is substituted per compile
+_PAPER_HEIGHT_PLACEHOLDER = "__PAPER_HEIGHT__"
+_PAPER_HEIGHT_SETTING = f"paperheight={_PAPER_HEIGHT_PLACEHOLDER}in".encode("ascii")
+
+# Draft-mode probes write no PDF, so the document reports its own page count
+# (the page counter is one past the last shipped page after \clearpage)
+_PAGE_COUNT_HOOK = r"\AtEndDocument{\clearpage\typeout{RESUME-PAGES=\the\numexpr\value{page}-1\relax}}"
+_DRAFT_BEGIN_DOCUMENT = (_PAGE_COUNT_HOOK + "\n\\begin{document}").encode("ascii")
+_PAGE_COUNT_RE = re.compile(r"^RESUME-PAGES=(\d+)", re.M)
+# Summary line pdflatex prints (and writes to the log) after a full (non-draft) run
+_OUTPUT_PAGES_RE = re.compile(r"Output written on .*?\((\d+) pages?")
+# Only documents with cross-references can need a second pass, and only when
+# pdflatex asks for one
+_CROSS_REF_RE = re.compile(r"\\(?:ref|pageref|cite|tableofcontents|bibliography)\b")
+_RERUN_RE = re.compile(r"Rerun to get|Label\(s\) may have changed")
+# TeX errors a different page size can avoid; any other error recurs at every
+# height and font size
+_HEIGHT_DEPENDENT_ERROR_RE = re.compile(r"! (?:Dimension too large|Output loop|Float\(s\) lost|Too many unprocessed floats)")
+# Output lines kept from a pdflatex run: errors and the lines the patterns above
+# look for. Everything else only feeds a short tail for debugging.
+_NOTABLE_OUTPUT_RE = re.compile(r"^(?:!|RESUME-PAGES=|Output written on )|Error:|Fatal error|Emergency stop|Rerun to get|Label\(s\) may have changed")
+_OUTPUT_TAIL_LINES = 50
+# Bytes read from the end of a log when looking for the output summary
+_LOG_TAIL_BYTES = 8192
+# Files pdflatex leaves next to resume.tex besides the PDF (.out is hyperref's)
+_AUXILIARY_SUFFIXES = (".aux", ".log", ".out")
+
+# Build directories go on tmpfs when the host has one; RESUME_PDF_TMPDIR overrides
+_TMPFS_DIR = "/dev/shm"
+
+def _make_temp_dir(prefix: str) -> str:
+    """Create a temporary directory under RESUME_PDF_TMPDIR, /dev/shm or the system default, in that order."""
+    for root in (os.environ.get("RESUME_PDF_TMPDIR"), _TMPFS_DIR):
+        if root and os.path.isdir(root) and os.access(root, os.W_OK):
+            try:
+                return tempfile.mkdtemp(prefix=prefix, dir=root)
+            except OSError as e:
+                logger.warning(f"Could not create a temporary directory in {root}: {e}")
+    return tempfile.mkdtemp(prefix=prefix)
+
+# One working directory per process holds the preloaded formats and every
+# per-call build directory; whatever is left in it is removed at exit
+_work_dir: Optional[Path] = None
+_work_dir_lock = threading.Lock()
+
+def _get_work_dir() -> Path:
+    """Return the process-wide working directory, (re)creating it if needed."""
+    global _work_dir
+    with _work_dir_lock:
+        # Long-running servers can have idle directories swept by tmp cleaners
+        if _work_dir is None or not _work_dir.is_dir():
+            _work_dir = Path(_make_temp_dir("resume_latex_"))
+            atexit.register(shutil.rmtree, _work_dir, ignore_errors=True)
+        return _work_dir
+
+# Preloaded formats: the class and package part of the preamble is dumped once
+# with mylatexformat, so later runs start from the format instead of re-reading
+# every package. The dump stops before hyperref (which cannot be dumped) or the
+# per-height geometry line, whichever comes first.
+_FORMAT_DUMP_SPLIT_RE = re.compile(r"^\\(?:usepackage(?:\[[^\]]*\])?\{hyperref\}|geometry\{paperheight=)", re.M)
+_format_dir: Optional[Path] = None
+_format_env: Optional[Dict[str, str]] = None
+_formats: Dict[str, Optional[str]] = {} # Preamble hash -> format name, None if it could not be built
+_formats_lock = threading.Lock()
+
+def _mark_format_dump(latex_content: str) -> Tuple[str, Optional[str]]:
+    """
+    Insert mylatexformat's \\endofdump marker into latex_content.
+    
+    Returns:
+        Tuple of (marked content, key of the dumpable preamble), or
+        (latex_content, None) if there is no stable preamble to dump.
+    """
+    match = _FORMAT_DUMP_SPLIT_RE.search(latex_content)
+    if not match:
+        return latex_content, None
+    static_preamble = latex_content[:match.start()]
+    key = hashlib.sha1(static_preamble.encode("utf-8")).hexdigest()[:16]
+    return static_preamble + "\\csname endofdump\\endcsname\n" + latex_content[match.start():], key
+
+def _preloaded_format(key: str, marked_content: bytes) -> Optional[str]:
+    """Return the name of the format for key, dumping it from marked_content on first use."""
+    global _format_dir, _format_env
+    with _formats_lock:
+        if _format_dir is None or not _format_dir.is_dir():
+            # First use, or the working directory was swept and the formats with it
+            _formats.clear()
+            _format_dir = _get_work_dir() / "formats"
+            _format_dir.mkdir(exist_ok=True)
+            # An empty entry keeps kpathsea's default format path after ours
+            _format_env = dict(os.environ, TEXFORMATS=f"{_format_dir}{os.pathsep}")
+        if key in _formats:
+            return _formats[key]
+        name = f"resume_{key}"
+        (_format_dir / f"{name}.tex").write_bytes(marked_content)
+        try:
+            process = subprocess.run(
+                ["pdflatex", "-ini", "-interaction=nonstopmode", f"-jobname={name}",
+                 "&pdflatex", "mylatexformat.ltx", f"{name}.tex"],
+                cwd=_format_dir, capture_output=True, text=True, check=False,
+            )
+            built = process.returncode == 0 and (_format_dir / f"{name}.fmt").exists()
+        except OSError as e:
+            logger.warning(f"Could not run pdflatex to dump a preloaded format: {e}")
+            built = False
+        if built:
+            logger.info(f"Dumped preloaded LaTeX format {name}")
+        else:
+            logger.warning("Could not dump a preloaded LaTeX format (is mylatexformat installed?). Compiling without one.")
+        _formats[key] = name if built else None
+        return _formats[key]
 
-# Helper for floating point range
-def frange(start, stop, step):
-    """Generate a range of floating point numbers."""
-    current = start
-    while current < stop:
-        yield current
-        current += step
+def _discard_format(key: str) -> None:
+    """Stop using the format for key after a compile with it failed where a plain one succeeded."""
+    with _formats_lock:
+        _formats[key] = None
 
 def generate_latex_resume(resume_data: Dict[str, Any]) -> str:
     """
@@ -51,10 +197,294 @@ def generate_latex_resume(resume_data: Dict[str, Any]) -> str:
     # Use the template generator with default height
     return generate_latex_content(resume_data)
 
+def _flowing_text_lengths(value: Any, in_list: bool = False):
+    """Yield the lengths of the strings in value that are typeset as running text (list items)."""
+    if isinstance(value, str):
+        if in_list:
+            yield len(value)
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _flowing_text_lengths(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _flowing_text_lengths(item, in_list=True)
+
+def predict_height(resume_data: Dict[str, Any]) -> float:
+    """
+    Estimate a lower bound for the page height (inches) the resume needs at 11pt.
+    
+    Bullets, skill lists and top-level text such as the summary are assumed to
+    pack into completely full lines with no headings or spacing, so a real
+    layout needs at least this much height. Clamped to the searched range.
+    """
+    total_chars = sum(_flowing_text_lengths(list(resume_data.values())))
+    height = _VERTICAL_MARGIN_INCHES + total_chars / _MAX_CHARS_PER_LINE * _LINE_HEIGHT_INCHES
+    return min(max(height, DEFAULT_MIN_HEIGHT_INCHES), MAX_HEIGHT_INCHES)
+
+def _render_latex_template(resume_data: Dict[str, Any], reduce_font_size: bool) -> Tuple[bytes, Optional[str], bool]:
+    """
+    Render the resume once for a font size, with a placeholder paper height.
+    
+    Returns:
+        Tuple of (UTF-8 LaTeX source marked for the preloaded format, format key,
+        whether the source has cross-references), as consumed by
+        _compile_resume_at_height.
+    """
+    latex_content = generate_latex_content(
+        resume_data,
+        target_paper_height_value_str=_PAPER_HEIGHT_PLACEHOLDER,
+        reduce_font_size=reduce_font_size
+    )
+    if LATEX_ENGINE == "tectonic":
+        # tectonic runs XeTeX, which lacks this pdfTeX-only primitive
+        latex_content = latex_content.replace("\\pdfgentounicode=1\n", "")
+    latex_content, format_key = _mark_format_dump(latex_content)
+    # The resume template has no cross-references, so one pass normally suffices
+    needs_second_pass = _CROSS_REF_RE.search(latex_content) is not None
+    return latex_content.encode("utf-8"), format_key, needs_second_pass
+
+class _StructuralLatexError(Exception):
+    """A compile failed with an error that no page height or font size can fix."""
+
+class _LatexEngineError(Exception):
+    """The LaTeX engine could not be started at all (missing binary, permissions)."""
+
+def _run_pdflatex(cmd: list, cwd: Path, env: Optional[Dict[str, str]]) -> Tuple[int, str, deque]:
+    """
+    Run pdflatex (or tectonic), streaming its output rather than buffering all of it.
+    
+    The output is read to the end; -halt-on-error already stops pdflatex at
+    its first error, right after the context lines (l.NN ...) that explain it.
+    
+    Returns:
+        Tuple of (return code, notable output lines, last _OUTPUT_TAIL_LINES lines).
+    """
+    notable = []
+    tail = deque(maxlen=_OUTPUT_TAIL_LINES)
+    with subprocess.Popen(
+        cmd, cwd=cwd, env=env, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT, text=True, errors="replace",
+    ) as process:
+        for line in process.stdout:
+            tail.append(line)
+            if _NOTABLE_OUTPUT_RE.search(line):
+                notable.append(line)
+    return process.returncode, "".join(notable), tail
+
+def _compile_resume_at_height(
+    latex_template: Tuple[bytes, Optional[str], bool],
+    temp_dir_path: Path,
+    current_height: float,
+    font_size_reduced_attempted: bool,
+    output_file: Optional[Path] = None,
+    draft: bool = True,
+) -> Optional[int]:
+    """
+    Compile the resume at a single paper height inside temp_dir_path.
+    
+    latex_template comes from _render_latex_template for the font size in use.
+    If output_file is given, a failed compile's log is saved next to it.
+    
+    Every file is written relative to temp_dir_path (no chdir), so compiles in
+    different directories can run concurrently. Draft runs (pdflatex -draftmode)
+    typeset and break pages without writing a PDF, which is all the height
+    search needs; a non-draft run leaves resume.pdf in temp_dir_path.
+    
+    Returns:
+        The page count, or None if compilation failed.
+    
+    Raises:
+        _StructuralLatexError: If the source itself is broken, so that the
+            search stops instead of compiling it at every other height.
+        _LatexEngineError: If the engine cannot be run, for the same reason.
+    """
+    logger.info(f"Attempting PDF generation with height: {current_height:.1f} inches. Reduced font: {font_size_reduced_attempted}. Draft: {draft}")
+    tex_file_name = "resume.tex"
+    pdf_file_name = "resume.pdf"
+    tex_file_path = temp_dir_path / tex_file_name
+    
+    latex_bytes, format_key, needs_second_pass = latex_template
+    latex_bytes = latex_bytes.replace(_PAPER_HEIGHT_SETTING, f"paperheight={current_height:.2f}in".encode("ascii"), 1)
+    # tectonic prints no output summary, so its runs always report their page count
+    if draft or LATEX_ENGINE == "tectonic":
+        latex_bytes = latex_bytes.replace(b"\\begin{document}", _DRAFT_BEGIN_DOCUMENT, 1)
+    tex_file_path.write_bytes(latex_bytes)
+    format_name = _preloaded_format(format_key, latex_bytes) if format_key and LATEX_ENGINE == "pdflatex" else None
+    format_failed = False
+
+    compilation_successful_this_iteration = False
+    notable_output = ""
+    for _ in range(MAX_ITERATIONS_PER_HEIGHT): 
+        if LATEX_ENGINE == "tectonic":
+            # No draft mode: tectonic always writes the PDF. --print passes the
+            # engine's terminal output through, including the page count marker.
+            cmd = ["tectonic", "-X", "compile", "--print", "--outfmt", "pdf", tex_file_name]
+        else:
+            cmd = [
+                "pdflatex",
+                "-interaction=nonstopmode",
+                "-halt-on-error",
+                tex_file_name
+            ]
+            if draft:
+                cmd.insert(1, "-draftmode")
+            if format_name:
+                cmd.insert(1, f"-fmt={format_name}")
+        try:
+            returncode, notable_output, output_tail = _run_pdflatex(cmd, temp_dir_path, _format_env if format_name else None)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Command: {' '.join(cmd)} (in {temp_dir_path}), return code: {returncode}")
+            
+            if returncode == 0:
+                compilation_successful_this_iteration = True
+                compile_output = notable_output
+                if format_failed:
+                    _discard_format(format_key)
+                if needs_second_pass and _RERUN_RE.search(notable_output):
+                    continue
+                break 
+            else:
+                logger.warning(f"LaTeX compilation failed for height {current_height:.1f} inches (Reduced font: {font_size_reduced_attempted}). RC: {returncode}")
+                if notable_output:
+                    logger.warning("Relevant pdflatex errors:\n" + notable_output.rstrip("\n"))
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Last {_OUTPUT_TAIL_LINES} lines of pdflatex output:\n" + "".join(output_tail).rstrip("\n"))
+                compilation_successful_this_iteration = False
+                retry = format_name is not None
+                if format_name:
+                    # Retry without the preloaded format in case it is at fault
+                    format_name = None
+                    format_failed = True
+                # Save log on failure
+                log_file_path = temp_dir_path / "resume.log"
+                if output_file and log_file_path.exists():
+                    try:
+                        font_suffix = "_10.5pt" if font_size_reduced_attempted else "_11pt"
+                        failed_log_path = output_file.with_name(f"{output_file.stem}_{current_height:.1f}in{font_suffix}_FAILED.log")
+                        shutil.copy(log_file_path, failed_log_path)
+                        logger.info(f"Saved FAILED log: {failed_log_path}")
+                    except Exception as e_log:
+                        logger.warning(f"Could not save FAILED log: {e_log}")
+                if not retry:
+                    break # Recompiling the same source would fail the same way
+        except OSError as e:
+            # Popen failed, so every other height and font size would fail the same way
+            raise _LatexEngineError(f"Could not run {cmd[0]}: {e}") from e
+        except Exception as e:
+            logger.error(f"Unexpected error during LaTeX compilation (Height: {current_height:.1f}, Reduced: {font_size_reduced_attempted}): {e}")
+
+    num_pages = None
+    if not compilation_successful_this_iteration:
+        logger.warning(f"Compilation failed (Height: {current_height:.1f}, Reduced: {font_size_reduced_attempted}).")
+    elif not draft:
+        # Both page counts are printed on pdflatex's stdout, so the log is not reread
+        pdf_file_in_temp = temp_dir_path / pdf_file_name
+        if not pdf_file_in_temp.exists():
+            logger.warning(f"PDF file not found after supposed success (Height: {current_height:.1f}, Reduced: {font_size_reduced_attempted}).")
+        else:
+            match = _OUTPUT_PAGES_RE.search(compile_output) or _PAGE_COUNT_RE.search(compile_output)
+            num_pages = int(match.group(1)) if match else get_pdf_page_count(str(pdf_file_in_temp))
+    else:
+        match = _PAGE_COUNT_RE.search(compile_output)
+        if not match:
+            logger.warning(f"Page count not reported by draft compile (Height: {current_height:.1f}, Reduced: {font_size_reduced_attempted}).")
+        else:
+            num_pages = int(match.group(1))
+            logger.info(f"Draft compile has {num_pages} page(s) for height {current_height:.1f} inches (Reduced font: {font_size_reduced_attempted}).")
+
+    # Nothing reads the auxiliary files once the page count is known (a FAILED
+    # log has already been copied out), so keep the directory down to .tex/.pdf
+    for suffix in _AUXILIARY_SUFFIXES:
+        (temp_dir_path / f"resume{suffix}").unlink(missing_ok=True)
+    if not compilation_successful_this_iteration:
+        # -halt-on-error stops pdflatex at its first error, so there is at most one
+        tex_error = next((line for line in notable_output.splitlines() if line.startswith("!")), None)
+        if tex_error and not _HEIGHT_DEPENDENT_ERROR_RE.match(tex_error):
+            raise _StructuralLatexError(tex_error)
+    return num_pages
+
+def _find_best_height(
+    latex_template: Tuple[bytes, Optional[str], bool],
+    temp_dir_path: Path,
+    heights_to_try: Tuple[float, ...],
+    font_size_reduced_attempted: bool,
+    output_file: Optional[Path],
+    probes: Dict[int, Optional[int]],
+    stop_if_multi_page: bool,
+) -> Optional[Tuple[float, int]]:
+    """
+    Search for the smallest height with as few pages as the tallest height allows
+    (a single page whenever possible), using draft compiles.
+    
+    Page count never grows with page height, so each round compiles up to
+    MAX_PARALLEL_PROBES evenly spaced heights concurrently and narrows the range
+    to the gap where the page count drops (plain bisection with one worker).
+    probes maps height index to page count for heights already compiled, and is
+    filled in as the search goes. With stop_if_multi_page, the max height is
+    returned as soon as it is known not to fit on one page.
+    
+    Returns:
+        Tuple of (height, num_pages), or None if no height compiled.
+    """
+    def probe_all(indices):
+        # Each probe compiles in its own directory, since pdflatex writes its aux
+        # and log files next to the .tex
+        pending = [i for i in indices if i not in probes]
+        work_dirs = []
+        for index in pending:
+            work_dir = temp_dir_path / f"probe_{heights_to_try[index]:.2f}{'_reduced' if font_size_reduced_attempted else ''}"
+            work_dir.mkdir(exist_ok=True)
+            work_dirs.append(work_dir)
+        def compile_one(index, work_dir):
+            return _compile_resume_at_height(
+                latex_template, work_dir, heights_to_try[index], font_size_reduced_attempted, output_file
+            )
+        if len(pending) == 1:
+            probes[pending[0]] = compile_one(pending[0], work_dirs[0])
+        elif pending:
+            futures = [_probe_executor.submit(compile_one, index, work_dir) for index, work_dir in zip(pending, work_dirs)]
+            # Let the whole round finish before an error propagates, since the
+            # caller removes the build directory
+            wait(futures)
+            for index, future in zip(pending, futures):
+                probes[index] = future.result()
+
+    last_index = len(heights_to_try) - 1
+    probe_all([0])
+    if probes[0] == 1:
+        return heights_to_try[0], 1
+
+    # lo never matches the page count at max height, hi always does
+    lo, hi = 0, last_index
+    pages_at_max = None
+    while hi - lo > 1 or pages_at_max is None:
+        # The max height goes into the first round alongside the interior heights
+        indices = [] if last_index in probes else [last_index]
+        interior = max(0, min(MAX_PARALLEL_PROBES - len(indices), hi - lo - 1))
+        indices += [lo + (j * (hi - lo)) // (interior + 1) for j in range(1, interior + 1)]
+        probe_all(indices)
+        if pages_at_max is None:
+            pages_at_max = probes[last_index]
+            if pages_at_max is None:
+                return None
+            if pages_at_max > 1 and stop_if_multi_page:
+                logger.info(f"Reached max height ({heights_to_try[last_index]:.1f}in) with {pages_at_max} pages (Reduced font: {font_size_reduced_attempted}). This is a candidate for final output if single page not achieved.")
+                return heights_to_try[last_index], pages_at_max
+            if probes[0] == pages_at_max:
+                return heights_to_try[0], pages_at_max
+        for index in sorted(i for i in indices if lo < i < hi):
+            if probes[index] == pages_at_max:
+                hi = index
+                break
+            lo = index
+    return heights_to_try[hi], pages_at_max
+
 def generate_pdf_from_latex(resume_data: Dict[str, Any], output_path: Optional[str] = None) -> Tuple[str, bool]:
     """
     Generate a PDF from resume data with adaptive page sizing.
-    Tries to fit content on a single page by iteratively increasing page height.
+    Finds the smallest page height that fits the content on a single page by
+    searching the candidate heights with concurrent draft compiles, then renders
+    the PDF once at the chosen height.
     
     Args:
         resume_data: The parsed resume data as a dictionary
@@ -71,181 +501,91 @@ def generate_pdf_from_latex(resume_data: Dict[str, Any], output_path: Optional[s
     clear_api_cache_diagnostic()
     logger.info("Called clear_api_cache_diagnostic() from resume_generator.")
 
-    original_cwd = os.getcwd()  # Save current working directory
     final_pdf_path_str = ""
     success = False
 
-    heights_to_try = list(frange(DEFAULT_MIN_HEIGHT_INCHES, MAX_HEIGHT_INCHES + HEIGHT_INCREMENT_INCHES, HEIGHT_INCREMENT_INCHES))
+    # Heights below the predicted lower bound cannot fit the normal font size.
+    # The search starts one step below it, so a slight overestimate still finds
+    # the shortest height that fits.
+    predicted_height = predict_height(resume_data)
+    first_height_index = max(min(bisect_left(_HEIGHTS, predicted_height), len(_HEIGHTS) - 1) - 1, 0)
+    if first_height_index:
+        logger.info(f"Predicted height {predicted_height:.2f}in; starting the search at {_HEIGHTS[first_height_index]:.1f}in.")
+    
+    output_file = Path(output_path) if output_path else None
     
     # Create a temporary directory for LaTeX processing
-    with tempfile.TemporaryDirectory() as temp_dir_name:
-        temp_dir_path = Path(temp_dir_name)
-        tex_file_name = "resume.tex"
-        pdf_file_name = "resume.pdf"
-        tex_file_path = temp_dir_path / tex_file_name
+    temp_dir_path = Path(tempfile.mkdtemp(prefix="build_", dir=_get_work_dir()))
+    try:
+        tex_file_path = temp_dir_path / "resume.tex"
         
         font_size_reduced_attempted = False # Flag to track if we've tried reducing font size
+        chosen = None # (height, reduced font, num_pages) to render
+        pdf_ready = False # Whether resume.pdf already holds the chosen layout
+        latex_templates = {} # Reduced font -> rendered template
 
-        for attempt_count in range(2): # Max 2 attempts: 1 normal, 1 with reduced font size
-            if attempt_count == 1 and not success: # If first attempt failed (not single page)
-                logger.info("First attempt failed to produce a single page. Attempting with reduced font size (10.5pt).")
-                font_size_reduced_attempted = True
-            elif attempt_count == 1 and success: # First attempt succeeded
-                break # No need for a second attempt
-
-            current_best_pdf_path_this_attempt = None
-            current_best_page_count_this_attempt = float('inf')
-
-            for current_height in heights_to_try:
-                logger.info(f"Attempting PDF generation with height: {current_height:.1f} inches. Reduced font: {font_size_reduced_attempted}")
-                
-                latex_content = generate_latex_content(
-                    resume_data, 
-                    target_paper_height_value_str=f"{current_height:.2f}",
-                    reduce_font_size=font_size_reduced_attempted
+        try:
+            for attempt_count in range(2): # Max 2 attempts: 1 normal, 1 with reduced font size
+                probes = {} # Height index -> page count for this font size
+                if attempt_count == 1:
+                    logger.info("First attempt failed to produce a single page. Attempting with reduced font size (10.5pt).")
+                    font_size_reduced_attempted = True
+                latex_templates[font_size_reduced_attempted] = _render_latex_template(resume_data, font_size_reduced_attempted)
+                attempt_heights = _HEIGHTS
+                if attempt_count == 0:
+                    attempt_heights = _HEIGHTS[first_height_index:]
+                    # Most resumes fit at the first candidate height, so that compile writes
+                    # the PDF as well; when it fits no other run is needed
+                    probes[0] = _compile_resume_at_height(
+                        latex_templates[False], temp_dir_path, attempt_heights[0], font_size_reduced_attempted, output_file, draft=False
+                    )
+                    pdf_ready = probes[0] == 1
+
+                best = _find_best_height(
+                    latex_templates[font_size_reduced_attempted], temp_dir_path, attempt_heights, font_size_reduced_attempted, output_file,
+                    probes, stop_if_multi_page=(attempt_count == 0),
                 )
-                with open(tex_file_path, 'w', encoding='utf-8') as f:
-                    f.write(latex_content)
-                
-                # Save .tex for inspection if output_path is provided
-                if output_path:
-                    try:
-                        base_name = Path(output_path).stem
-                        tex_output_dir = Path(output_path).parent
-                        font_suffix = "_10.5pt" if font_size_reduced_attempted else "_11pt"
-                        inspection_tex_path = tex_output_dir / f"{base_name}_{current_height:.1f}in{font_suffix}.tex"
-                        # shutil.copy(tex_file_path, inspection_tex_path) # Keep this commented for now
-                        # logger.info(f"Saved .tex for inspection: {inspection_tex_path}")
-                    except Exception as e:
-                        logger.warning(f"Could not save inspection .tex file: {e}")
-
-                os.chdir(temp_dir_path) # Change to temp dir for latexmk
-                
-                compilation_successful_this_iteration = False
-                for _ in range(MAX_ITERATIONS_PER_HEIGHT): 
-                    cmd = [
-                        "pdflatex",
-                        "-interaction=nonstopmode",
-                        tex_file_name
-                    ]
-                    try:
-                        process = subprocess.run(cmd, capture_output=True, text=True, check=False)
-                        
-                        # Print detailed output for debugging
-                        print("\n--- PDFLATEX OUTPUT - START ---")
-                        print(f"Command: {' '.join(cmd)}")
-                        print(f"Return code: {process.returncode}")
-                        
-                        # Look for critical errors in the output
-                        print("\n--- RELEVANT ERROR MESSAGES ---")
-                        for line in process.stdout.splitlines():
-                            if "Error:" in line or "Fatal error" in line or "Emergency stop" in line:
-                                print(line)
-                        
-                        # Always save log file for debugging
-                        log_file = temp_dir_path / "resume.log"
-                        if log_file.exists():
-                            with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
-                                log_content = f.read()
-                                print("\n--- LAST 50 LINES OF LATEX LOG ---")
-                                log_lines = log_content.splitlines()
-                                print('\n'.join(log_lines[-50:]))
-                        
-                        print("--- PDFLATEX OUTPUT - END ---\n")
-                        
-                        if process.returncode == 0:
-                            compilation_successful_this_iteration = True
-                            break 
-                        else:
-                            logger.warning(f"LaTeX compilation failed for height {current_height:.1f} inches (Reduced font: {font_size_reduced_attempted}). RC: {process.returncode}")
-                            # Save log on failure
-                            log_file_path = temp_dir_path / "resume.log"
-                            if output_path and log_file_path.exists():
-                                try:
-                                    base_name = Path(output_path).stem
-                                    log_output_dir = Path(output_path).parent
-                                    font_suffix = "_10.5pt" if font_size_reduced_attempted else "_11pt"
-                                    failed_log_path = log_output_dir / f"{base_name}_{current_height:.1f}in{font_suffix}_FAILED.log"
-                                    shutil.copy(log_file_path, failed_log_path)
-                                    logger.info(f"Saved FAILED log: {failed_log_path}")
-                                except Exception as e_log:
-                                    logger.warning(f"Could not save FAILED log: {e_log}")
-                    except Exception as e:
-                        logger.error(f"Unexpected error during LaTeX compilation (Height: {current_height:.1f}, Reduced: {font_size_reduced_attempted}): {e}")
-                
-                os.chdir(original_cwd) 
-
-                if compilation_successful_this_iteration:
-                    pdf_file_in_temp = temp_dir_path / pdf_file_name
-                    if pdf_file_in_temp.exists():
-                        num_pages = get_pdf_page_count(str(pdf_file_in_temp))
-                        logger.info(f"Generated PDF has {num_pages} page(s) for height {current_height:.1f} inches (Reduced font: {font_size_reduced_attempted}).")
-                        
-                        # Track the best PDF (fewest pages) for this attempt (normal or reduced font)
-                        if num_pages < current_best_page_count_this_attempt:
-                            current_best_page_count_this_attempt = num_pages
-                            # Save this PDF to a temporary location within the loop if it's the best so far for this font size attempt
-                            # This is important because we might overwrite it in the next height iteration
-                            temp_best_pdf_for_font_attempt = temp_dir_path / f"best_so_far_font_attempt_{attempt_count}.pdf"
-                            shutil.copy(pdf_file_in_temp, temp_best_pdf_for_font_attempt)
-                            current_best_pdf_path_this_attempt = str(temp_best_pdf_for_font_attempt)
-
-
-                        if num_pages == 1:
-                            logger.info(f"Single-page PDF successfully generated with height: {current_height:.1f} inches (Reduced font: {font_size_reduced_attempted}).")
-                            if output_path:
-                                Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-                                shutil.copy(pdf_file_in_temp, output_path)
-                                final_pdf_path_str = output_path
-                                logger.info(f"PDF saved to: {output_path}")
-                            else:
-                                final_pdf_path_str = str(pdf_file_in_temp) # Should be copied to a persistent temp if needed outside
-                            success = True
-                            break # Exit height loop for this font size attempt
-                        elif num_pages > 1 and current_height >= MAX_HEIGHT_INCHES - 1e-6: 
-                            logger.info(f"Reached max height ({current_height:.1f}in) with {num_pages} pages (Reduced font: {font_size_reduced_attempted}). This is a candidate for final output if single page not achieved.")
-                            # Don't break yet, let the outer loop decide if this is the final one
-                    else:
-                        logger.warning(f"PDF file not found after supposed success (Height: {current_height:.1f}, Reduced: {font_size_reduced_attempted}).")
+                if best is None:
+                    continue
+                # A multi-page result from the reduced font attempt is preferred over the normal one
+                chosen = (best[0], font_size_reduced_attempted, best[1])
+                if best[1] == 1:
+                    break # Single page found, no need for a second attempt
+                logger.info(f"Font attempt {attempt_count+1} (Reduced: {font_size_reduced_attempted}) did not yield a single page. Best was {best[1]} pages.")
+        except _StructuralLatexError as e:
+            # Taller pages or a smaller font cannot fix a broken document
+            logger.error(f"LaTeX source error, not trying other heights or font sizes: {e}")
+        except _LatexEngineError as e:
+            logger.error(f"{e}. Is {LATEX_ENGINE} installed and on PATH? Not trying other heights or font sizes.")
+
+        if chosen is not None:
+            current_height, reduced_font, num_pages = chosen
+            # Render the actual PDF once, at the chosen height
+            if pdf_ready or _compile_resume_at_height(latex_templates[reduced_font], temp_dir_path, current_height, reduced_font, output_file, draft=False) is not None:
+                pdf_file_in_temp = temp_dir_path / "resume.pdf"
+                if output_file:
+                    output_file.parent.mkdir(parents=True, exist_ok=True)
+                    # The build directory is discarded, so move rather than copy
+                    # (a rename when it shares a filesystem with output_path)
+                    shutil.move(str(pdf_file_in_temp), output_path)
+                    final_pdf_path_str = output_path
                 else:
-                    logger.warning(f"Compilation failed (Height: {current_height:.1f}, Reduced: {font_size_reduced_attempted}).")
-            
-            # After trying all heights for the current font size attempt:
-            if success: # Single page was found
-                break # Exit the main attempt_count loop
-
-            # If no single-page PDF was found in this attempt (either normal or reduced font size)
-            # And if we have a multi-page PDF from this attempt (e.g., from MAX_HEIGHT)
-            # this becomes the current candidate for the final output if the other attempt also fails or if this is the reduced font attempt.
-            if not success and current_best_pdf_path_this_attempt and current_best_page_count_this_attempt > 1:
-                 logger.info(f"Font attempt {attempt_count+1} (Reduced: {font_size_reduced_attempted}) did not yield a single page. Best was {current_best_page_count_this_attempt} pages.")
-                 # If this is the reduced font attempt OR if it's the first attempt and no better solution is found
-                 # then this multi-page PDF is our fallback.
-                 if font_size_reduced_attempted or (attempt_count == 0 and not final_pdf_path_str): # Prioritize reduced font if both are multi-page
-                    if output_path and current_best_pdf_path_this_attempt:
-                        logger.info(f"Setting multi-page PDF from this attempt ({current_best_pdf_path_this_attempt}) as fallback.")
-                        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-                        shutil.copy(current_best_pdf_path_this_attempt, output_path)
-                        final_pdf_path_str = output_path
-                        # success remains False if it's multi-page, but we have a path
-                        success = False # Explicitly false for multi-page, even if it's "accepted"
-                        logger.info(f"Multi-page PDF ({current_best_page_count_this_attempt} pages) saved to: {output_path}")
-                    elif not output_path and current_best_pdf_path_this_attempt:
-                        # If no output_path, the caller needs to handle this temp file
-                        final_pdf_path_str = current_best_pdf_path_this_attempt
-                        success = False
-                        logger.info(f"Multi-page PDF ({current_best_page_count_this_attempt} pages) available at temp path: {final_pdf_path_str}")
-
+                    final_pdf_path_str = str(pdf_file_in_temp) # Should be copied to a persistent temp if needed outside
+                if num_pages == 1:
+                    logger.info(f"Single-page PDF successfully generated with height: {current_height:.1f} inches (Reduced font: {reduced_font}).")
+                    logger.info(f"PDF saved to: {final_pdf_path_str}")
+                    success = True
+                else:
+                    # success remains False if it's multi-page, but we have a path
+                    logger.info(f"Multi-page PDF ({num_pages} pages) saved to: {final_pdf_path_str}")
 
         if not success and not final_pdf_path_str: # If loop finishes and no PDF was ever successfully made and saved
             logger.error("PDF generation failed to produce any document after trying all specified heights and font sizes.")
             # Save last attempted .tex for debugging if output_path is specified
-            if output_path and tex_file_path.exists():
+            if output_file and tex_file_path.exists():
                  try:
-                    base_name = Path(output_path).stem
-                    tex_output_dir = Path(output_path).parent
                     font_suffix = "_10.5pt" if font_size_reduced_attempted else "_11pt" # Suffix from last attempt
-                    debug_tex_path = tex_output_dir / f"{base_name}_FAILED_ALL_ATTEMPTS{font_suffix}.tex"
+                    debug_tex_path = output_file.with_name(f"{output_file.stem}_FAILED_ALL_ATTEMPTS{font_suffix}.tex")
                     shutil.copy(tex_file_path, debug_tex_path)
                     logger.info(f"Saved last attempted .tex for debugging: {debug_tex_path}")
                  except Exception as e:
@@ -253,13 +593,14 @@ def generate_pdf_from_latex(resume_data: Dict[str, Any], output_path: Optional[s
         elif not success and final_pdf_path_str:
              logger.info(f"PDF generation resulted in a multi-page document saved at: {final_pdf_path_str}")
              # success is already False, path is set. This is an "accepted multi-page" scenario.
-
+    finally:
+        shutil.rmtree(temp_dir_path, ignore_errors=True)
 
     return final_pdf_path_str, success
 
 def get_pdf_page_count(pdf_path):
     """
-    Get the number of pages in a PDF file.
+    Get the number of pages in a PDF file produced by pdflatex.
     
     Args:
         pdf_path (str): Path to the PDF file
@@ -269,50 +610,24 @@ def get_pdf_page_count(pdf_path):
     """
     logger.info(f"Checking page count for: {pdf_path}")
     
-    # Method 1: Try using pdfinfo command (faster, less dependencies)
-    try:
-        result = subprocess.run(
-            ["pdfinfo", str(pdf_path)],
-            capture_output=True,
-            text=True,
-            check=False  # Don't raise exception on non-zero exit
-        )
-        
-        if result.returncode != 0:
-            logger.warning(f"Error running pdfinfo: {result.stderr}")
-        else:
-            # Parse the output to get page count
-            for line in result.stdout.splitlines():
-                if line.startswith("Pages:"):
-                    try:
-                        page_count = int(line.split(":", 1)[1].strip())
-                        logger.info(f"PDF has {page_count} page(s)")
-                        return page_count
-                    except (IndexError, ValueError) as e:
-                        logger.warning(f"Error parsing page count: {e}")
-    except FileNotFoundError:
-        logger.warning("pdfinfo command not found, trying alternative method...")
-    except Exception as e:
-        logger.warning(f"Unexpected error running pdfinfo: {e}")
-    
-    # Method 2: Use a simpler string search in the log file
+    # Method 1: Read the count from pdflatex's "Output written on ... (N pages" log line,
+    # which is among the last lines, so only the tail of the log is read
     log_file = str(pdf_path).replace('.pdf', '.log')
     if os.path.exists(log_file):
         try:
-            with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
-                log_content = f.read()
-                # Simple check for the single-page output indicator
-                if "(1 page" in log_content:
-                    logger.info("Found '(1 page' in log file. Assuming 1 page.")
-                    return 1
-                else:
-                    # If "(1 page" isn't found, assume > 1 page
-                    logger.info("Did not find '(1 page' pattern in log file. Assuming > 1 page.")
-                    return 2
+            with open(log_file, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                tail = os.pread(f.fileno(), min(size, _LOG_TAIL_BYTES), max(0, size - _LOG_TAIL_BYTES))
+            match = _OUTPUT_PAGES_RE.search(tail.decode('utf-8', errors='ignore'))
+            if match:
+                page_count = int(match.group(1))
+                logger.info(f"PDF has {page_count} page(s)")
+                return page_count
+            logger.info("Did not find the output summary in log file.")
         except Exception as e:
-            logger.warning(f"Error reading log file for simple check: {e}")
+            logger.warning(f"Error reading log file for page count: {e}")
 
-    # Method 3: Fallback - based on file size
+    # Method 2: Fallback - based on file size
     if os.path.exists(pdf_path) and os.path.getsize(pdf_path) > 0:
         logger.info(f"PDF file exists with size: {os.path.getsize(pdf_path)} bytes")
         # If file is larger than typical 1-page resume, assume it's multi-page
@@ -324,11 +639,65 @@ def get_pdf_page_count(pdf_path):
             return 1
     
     # Couldn't determine page count
-    logger.warning("Could not determine page count. Install pdfinfo (poppler-utils) for better results.")
+    logger.warning("Could not determine page count.")
     # Default to 2 pages if we can't determine to force height increases
     logger.warning("Defaulting to 2 pages to trigger page height increase")
     return 2
 
+def _pdf_cache_key(json_data: dict) -> str:
+    """Hash the resume data together with everything else that shapes the PDF (engine, template source)."""
+    digest = hashlib.sha256()
+    digest.update(json.dumps(json_data, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8"))
+    digest.update(LATEX_ENGINE.encode("ascii"))
+    digest.update(_TEMPLATE_SOURCE_PATH.read_bytes())
+    return digest.hexdigest()
+
+def _load_cached_pdf(cache_key: str, output_pdf_path: str) -> Optional[Tuple[str, bool]]:
+    """Copy a cached PDF for cache_key to output_pdf_path, returning (path, success) on a hit."""
+    cache_dir = Path(PDF_CACHE_DIR)
+    meta_path = cache_dir / f"{cache_key}.json"
+    try:
+        # The metadata is written last, so its presence marks a complete entry
+        success = json.loads(meta_path.read_text())["success"]
+        Path(output_pdf_path).parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(cache_dir / f"{cache_key}.pdf", output_pdf_path)
+        os.utime(meta_path) # Mark as recently used for eviction
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"Could not read cached PDF {cache_key}: {e}")
+        return None
+    logger.info(f"Using cached PDF {cache_key} for {output_pdf_path}")
+    return output_pdf_path, success
+
+def _store_cached_pdf(cache_key: str, pdf_path: str, success: bool) -> None:
+    """Add a generated PDF to the cache, evicting the least recently used entries beyond PDF_CACHE_MAX_ENTRIES."""
+    cache_dir = Path(PDF_CACHE_DIR)
+    try:
+        cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # mkdir leaves an existing directory's mode alone (and fails here if
+        # another user owns it); mkstemp below creates the files as 0600
+        os.chmod(cache_dir, 0o700)
+        # Write to unique temporary names and rename, so readers never see partial files
+        for suffix, data in (
+            (".pdf", Path(pdf_path).read_bytes()),
+            (".json", json.dumps({"success": success}).encode("utf-8")),
+        ):
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, cache_dir / f"{cache_key}{suffix}")
+            except OSError:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+        entries = sorted(cache_dir.glob("*.json"), key=lambda path: path.stat().st_mtime)
+        for stale in entries[:max(0, len(entries) - PDF_CACHE_MAX_ENTRIES)]:
+            stale.unlink(missing_ok=True)
+            stale.with_suffix(".pdf").unlink(missing_ok=True)
+    except OSError as e:
+        logger.warning(f"Could not cache generated PDF {cache_key}: {e}")
+
 def generate_resume_pdf(
     json_data: dict, 
     output_pdf_path: str,
@@ -353,11 +722,25 @@ def generate_resume_pdf(
     """
     logger.info("Starting end-to-end resume PDF generation")
     
+    cache_key = None
+    if PDF_CACHE_DIR and output_pdf_path:
+        try:
+            cache_key = _pdf_cache_key(json_data)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not compute PDF cache key: {e}")
+        if cache_key:
+            cached = _load_cached_pdf(cache_key, output_pdf_path)
+            if cached is not None:
+                return cached
+    
     try:
-        return generate_pdf_from_latex(json_data, output_pdf_path)
+        pdf_path, success = generate_pdf_from_latex(json_data, output_pdf_path)
     except Exception as e:
         logger.error(f"Error in end-to-end PDF generation: {e}")
         return "", False
+    if cache_key and pdf_path:
+        _store_cached_pdf(cache_key, pdf_path, success)
+    return pdf_path, success
 
 def proactively_generate_pdf(user_id: str, enhanced_resume_id: str, enhanced_resume_content: Dict[str, Any]) -> Optional[str]:
     """
@@ -469,7 +852,6 @@ if __name__ == "__main__":
     with open(fixed_height_tex, "w", encoding="utf-8") as f:
         f.write(latex_fixed)
     # Compile it (simplified, no error checking like in main function)
-    import subprocess
     subprocess.run(["pdflatex", "-interaction=nonstopmode", fixed_height_tex], check=False)
     print(f"Fixed height TeX saved to {fixed_height_tex}, PDF attempted: {fixed_height_pdf}")
     
@@ -31,8 +31,7 @@ def clear_api_cache_diagnostic(): # New function to clear cache
     """Clears the module-level API_CACHE."""
     global API_CACHE
     API_CACHE.clear()
-    # Using print here as logger might not be visible based on past issues
-    print("--- PRINT DIAGNOSTIC (resume_generator.py): API_CACHE cleared via utility function. ---", flush=True)
+    logger.debug("API_CACHE cleared via utility function.")
 
 def _initialize_openai_client() -> bool:
     """Initializes the OpenAI client if not already done. Returns True if successful or already initialized."""
@@ -45,18 +44,18 @@ def _initialize_openai_client() -> bool:
         # Only print warning once, or find a better way to log this if it becomes noisy.
         # For now, let's assume it's okay to print if called when client is None.
         if OPENAI_CLIENT is None: # Avoid repeated warnings if called multiple times without key
-            print("AI HINT: OPENAI_API_KEY environment variable not set. Skill/metric highlighting will be skipped.")
+            logger.warning("AI HINT: OPENAI_API_KEY environment variable not set. Skill/metric highlighting will be skipped.")
         OPENAI_API_KEY_LOADED = False
         return False
     
     try:
         OPENAI_CLIENT = openai.OpenAI(api_key=api_key)
         OPENAI_API_KEY_LOADED = True
-        print("AI HINT: OpenAI client initialized successfully for skill/metric highlighting.")
+        logger.info("AI HINT: OpenAI client initialized successfully for skill/metric highlighting.")
         return True
     except Exception as e:
         if OPENAI_CLIENT is None: # Avoid repeated warnings
-            print(f"AI HINT: Failed to initialize OpenAI client: {e}. Skill/metric highlighting will be skipped.")
+            logger.warning(f"AI HINT: Failed to initialize OpenAI client: {e}. Skill/metric highlighting will be skipped.")
         OPENAI_API_KEY_LOADED = False
         return False
 
@@ -253,9 +252,8 @@ def _generate_experience_section(experience_list: Optional[List[Dict[str, Any]]]
     if not experience_list:
         return None
 
-    print("--- PRINT DIAGNOSTIC (_generate_experience_section): Received experience_list ---", flush=True)
-    print(json.dumps(experience_list, indent=2), flush=True)
-    print("--- END PRINT DIAGNOSTIC (_generate_experience_section) ---", flush=True)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("_generate_experience_section received experience_list:\n%s", json.dumps(experience_list, indent=2))
 
     section_title = "Experience"
     content_lines = [f"\\section{{{section_title}}}"]
@@ -296,17 +294,13 @@ def _generate_experience_section(experience_list: Optional[List[Dict[str, Any]]]
                 content_lines.append("      \\resumeItemListEnd")
 
     content_lines.append("  \\resumeSubHeadingListEnd")
-    print("--- PRINT DIAGNOSTIC (_generate_experience_section): Received tech_skills ---", flush=True)
-    print(tech_skills, flush=True)
-    print("--- END PRINT DIAGNOSTIC (_generate_experience_section tech_skills) ---", flush=True)
+    logger.debug("_generate_experience_section received tech_skills: %s", tech_skills)
 
     return "\n".join(content_lines)
 
 def _generate_projects_section(project_list: Optional[List[Dict[str, Any]]], tech_skills: List[str], metrics: List[str]) -> Optional[str]:
     if not project_list: return None
-    print("--- PRINT DIAGNOSTIC (_generate_projects_section): Received tech_skills ---", flush=True)
-    print(tech_skills, flush=True)
-    print("--- END PRINT DIAGNOSTIC (_generate_projects_section tech_skills) ---", flush=True)
+    logger.debug("_generate_projects_section received tech_skills: %s", tech_skills)
 
     content_lines = []
     for proj in project_list:
@@ -365,17 +359,13 @@ def _generate_projects_section(project_list: Optional[List[Dict[str, Any]]], tec
 
 
 def _generate_skills_section(skills_dict: Optional[Dict[str, Any]], tech_skills: List[str]) -> Optional[str]:
-    print("--- PRINT DIAGNOSTIC (_generate_skills_section): Received skills_dict ---", flush=True)
-    try:
-        print(json.dumps(skills_dict, indent=2), flush=True)
-    except TypeError:
-        print("PRINT DIAGNOSTIC (_generate_skills_section): Could not serialize skills_dict.", flush=True)
-        print(str(skills_dict), flush=True)
-    print("--- END PRINT DIAGNOSTIC (_generate_skills_section) ---", flush=True)
-
-    print("--- PRINT DIAGNOSTIC (_generate_skills_section): Received tech_skills ---", flush=True)
-    print(tech_skills, flush=True)
-    print("--- END PRINT DIAGNOSTIC (_generate_skills_section tech_skills) ---", flush=True)
+    if logger.isEnabledFor(logging.DEBUG):
+        try:
+            skills_dump = json.dumps(skills_dict, indent=2)
+        except TypeError:
+            skills_dump = str(skills_dict)
+        logger.debug("_generate_skills_section received skills_dict:\n%s", skills_dump)
+        logger.debug("_generate_skills_section received tech_skills: %s", tech_skills)
 
     if not skills_dict: return None
     
@@ -664,12 +654,9 @@ def generate_latex_content(data: Dict[str, Any], template_path: Optional[str] =
         r"\newcommand{\resumeItemListEnd}{\end{itemize}}"
     ])
 
-    # --- DIAGNOSTIC PRINT OF PREAMBLE ---
-    print("--- AI DEBUG: Final Preamble Parts Being Used ---", flush=True)
-    for i, part in enumerate(preamble_parts):
-        print(f"Preamble Part [{i}]: {part}", flush=True)
-    print("--- AI DEBUG: End of Preamble Parts ---", flush=True)
-    # --- END DIAGNOSTIC --- 
+    if logger.isEnabledFor(logging.DEBUG):
+        for i, part in enumerate(preamble_parts):
+            logger.debug("Preamble Part [%s]: %s", i, part)
 
     doc_body_parts = ["\\begin{document}"]
     
@@ -723,7 +710,7 @@ def extract_highlights_from_resume(resume_data: Dict[str, Any]) -> tuple[List[st
     Returns two lists: (technical_skills, metrics). Returns empty lists if API unavailable.
     """
     if not _initialize_openai_client() or not OPENAI_CLIENT:
-        print("AI HINT DEBUG: OpenAI client not initialized or API key issue. Returning empty for highlights.", flush=True)
+        logger.debug("AI HINT DEBUG: OpenAI client not initialized or API key issue. Returning empty for highlights.")
         return [], []
 
     all_bullets: List[str] = []
@@ -749,12 +736,13 @@ def extract_highlights_from_resume(resume_data: Dict[str, Any]) -> tuple[List[st
 
     if not all_bullets:
         logger.info("AI HINT: No bullet points found for highlighting.")
-        print("AI HINT DEBUG: No bullet points gathered. Returning empty for highlights.", flush=True)
+        logger.debug("AI HINT DEBUG: No bullet points gathered. Returning empty for highlights.")
         return [], []
 
-    print(f"AI HINT DEBUG: Sending these bullets to OpenAI ({len(all_bullets)} total):", flush=True)
-    for i, bullet in enumerate(all_bullets):
-        print(f"  Bullet {i+1}: {bullet}", flush=True)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("AI HINT DEBUG: Sending these bullets to OpenAI (%s total):", len(all_bullets))
+        for i, bullet in enumerate(all_bullets):
+            logger.debug("  Bullet %s: %s", i+1, bullet)
 
     # Use cache to avoid repeated API calls
     cache_key = hashlib.md5("|".join(sorted(all_bullets)).encode("utf-8")).hexdigest()
@@ -791,19 +779,19 @@ Resume bullet points:
             response_format={"type": "json_object"}
         )
         content = response.choices[0].message.content
-        print(f"AI HINT DEBUG: Raw OpenAI JSON response:\n{content}", flush=True)
+        logger.debug("AI HINT DEBUG: Raw OpenAI JSON response:\n%s", content)
 
         if not content:
-            print("AI HINT DEBUG: OpenAI returned empty content. Returning empty for highlights.", flush=True)
+            logger.debug("AI HINT DEBUG: OpenAI returned empty content. Returning empty for highlights.")
             return [], []
         parsed = json.loads(content)
         tech_skills = parsed.get("technical_skills", [])
         metrics = parsed.get("metrics", [])
         if not isinstance(tech_skills, list):
-            print(f"AI HINT DEBUG: 'technical_skills' from OpenAI was not a list (type: {type(tech_skills)}). Forcing to empty list.", flush=True)
+            logger.debug("AI HINT DEBUG: 'technical_skills' from OpenAI was not a list (type: %s). Forcing to empty list.", type(tech_skills))
             tech_skills = []
         if not isinstance(metrics, list):
-            print(f"AI HINT DEBUG: 'metrics' from OpenAI was not a list (type: {type(metrics)}). Forcing to empty list.", flush=True)
+            logger.debug("AI HINT DEBUG: 'metrics' from OpenAI was not a list (type: %s). Forcing to empty list.", type(metrics))
             metrics = []
         
         # Filter out very short skills to avoid erroneous highlighting of common letters/bigrams
@@ -811,15 +799,15 @@ Resume bullet points:
         original_skill_count = len(tech_skills)
         tech_skills = [skill for skill in tech_skills if len(skill) >= MIN_SKILL_LEN]
         if len(tech_skills) != original_skill_count:
-            print(f"AI HINT DEBUG: Filtered OpenAI skills from {original_skill_count} to {len(tech_skills)} (min length {MIN_SKILL_LEN}).", flush=True)
+            logger.debug("AI HINT DEBUG: Filtered OpenAI skills from %s to %s (min length %s).", original_skill_count, len(tech_skills), MIN_SKILL_LEN)
             
         API_CACHE[cache_key] = {"technical_skills": tech_skills, "metrics": metrics}
-        print(f"AI HINT DEBUG: Parsed technical_skills from OpenAI (post-filter): {tech_skills}", flush=True)
-        print(f"AI HINT DEBUG: Parsed metrics from OpenAI: {metrics}", flush=True)
+        logger.debug("AI HINT DEBUG: Parsed technical_skills from OpenAI (post-filter): %s", tech_skills)
+        logger.debug("AI HINT DEBUG: Parsed metrics from OpenAI: %s", metrics)
         return tech_skills, metrics
     except Exception as e:
         logger.info(f"AI HINT: OpenAI call failed: {e}. Skipping highlighting, using fallback.")
-        print(f"AI HINT DEBUG: OpenAI call failed: {e}. Using fallback.", flush=True)
+        logger.debug("AI HINT DEBUG: OpenAI call failed: %s. Using fallback.", e)
         # Fallback: derive technical skills from skills section if available
         fallback_skills = set() # Use a set to avoid duplicates initially
         skills_root = resume_data.get("Skills") or resume_data.get("skills")
@@ -932,9 +920,7 @@ def format_bullet_with_highlights(bullet_text_raw: str, all_skills: List[str], a
     if not bullet_text_raw.strip():
         return ""
 
-    print(f"AI HINT DEBUG (format_bullet_with_highlights): Processing bullet: '{bullet_text_raw}'", flush=True)
-    print(f"AI HINT DEBUG (format_bullet_with_highlights): Using all_skills: {all_skills}", flush=True)
-    print(f"AI HINT DEBUG (format_bullet_with_highlights): Using all_metrics: {all_metrics}", flush=True)
+    logger.debug("AI HINT DEBUG (format_bullet_with_highlights): Processing bullet: '%s'", bullet_text_raw)
 
     # Identify all top-level highlight segments (metrics and skills not inside other captured metrics)
     # Each element: {'start': int, 'end': int, 'text': str_raw, 'type': 'metric'|'skill'}
@@ -966,7 +952,7 @@ def format_bullet_with_highlights(bullet_text_raw: str, all_skills: List[str], a
                 
     # Sort the chosen highlights by start position for sequential processing
     final_non_overlapping_highlights.sort(key=lambda x: x['start'])
-    print(f"AI HINT DEBUG (format_bullet_with_highlights): Final non-overlapping highlights: {final_non_overlapping_highlights}", flush=True)
+    logger.debug("AI HINT DEBUG (format_bullet_with_highlights): Final non-overlapping highlights: %s", final_non_overlapping_highlights)
 
     # Build the final string
     result_parts = []
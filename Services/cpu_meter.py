@@ -0,0 +1,30 @@
+# Non-blocking system CPU usage with a minimum sampling gap
+from threading import Lock
+from time import monotonic
+
+import psutil
+
+# psutil's cpu_percent(interval=None) compares against the previous call,
+# so readings taken less than about a second apart are noisy
+MIN_GAP = 1.0
+
+_lock = Lock()
+_last_ts = monotonic()
+_last_val = None
+
+# The first non-blocking call only establishes the baseline (returns 0.0)
+psutil.cpu_percent(interval=None)
+
+
+def cpu_percent():
+    """Return system CPU usage, re-sampling at most once per MIN_GAP seconds.
+
+    Returns None until MIN_GAP seconds have passed since import.
+    """
+    global _last_ts, _last_val
+    with _lock:
+        now = monotonic()
+        if now - _last_ts >= MIN_GAP:
+            _last_val = psutil.cpu_percent(interval=None)
+            _last_ts = now
+        return _last_val
@@ -0,0 +1,40 @@
+# Flask JSON provider backed by orjson, used for every jsonify() response
+import logging
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; Flask's stdlib provider is used instead
+    orjson = None
+
+
+logger = logging.getLogger(__name__)
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Serialize with orjson while keeping Flask's defaults (sorted keys,
+    HTTP-date datetimes, indentation in debug mode)."""
+
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=self.default, option=option).decode()
+        except TypeError:
+            # Types orjson rejects (e.g. integers beyond 64 bits) go through json
+            return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+def install_json_provider(app):
+    """Use ORJSONProvider for app when orjson is installed."""
+    if orjson is None:
+        logger.info("orjson not installed; using Flask's default JSON provider")
+        return
+    app.json = ORJSONProvider(app)
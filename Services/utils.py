@@ -1,16 +1,23 @@
 
 from datetime import datetime
+import functools
+import hashlib
 from pathlib import Path
+import threading
 import time
 import uuid
 
-from flask import current_app, g, jsonify
+from flask import Response, current_app, g, jsonify, request
 import requests
 
 from Services.openai_interface import OPENAI_API_BASE, OPENAI_API_KEY
 
 START_TIME = time.time()
 
+# (timestamp, components) from the last get_component_status() probe
+_component_status_cache = (0.0, None)
+_component_status_lock = threading.Lock()
+
 def get_uptime():
     """Get application uptime in human readable format"""
     start_time = current_app.config.get("START_TIME", START_TIME)
@@ -33,6 +40,25 @@ def format_uptime(seconds):
     else:
         return f"{int(seconds)}s"
 
+def timed_lru_cache(ttl, maxsize=2):
+    """Memoize a function for ttl seconds.
+
+    Results are keyed on the current time bucket (time // ttl), so a small
+    maxsize keeps at most the fresh entry plus one stale one.
+    """
+    def decorator(func):
+        @functools.lru_cache(maxsize=maxsize)
+        def cached(bucket, *args, **kwargs):
+            return func(*args, **kwargs)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return cached(int(time.time() // ttl), *args, **kwargs)
+
+        wrapper.cache_clear = cached.cache_clear
+        return wrapper
+    return decorator
+
 def format_size(size_bytes):
     """Format bytes to human readable size."""
     for unit in ["B", "KB", "MB", "GB", "TB"]:
@@ -41,6 +67,28 @@ def format_size(size_bytes):
         size_bytes /= 1024.0
     return f"{size_bytes:.2f} PB"
 
+@functools.lru_cache(maxsize=8)
+def _body_etag(body):
+    return hashlib.blake2b(body.encode(), digest_size=8).hexdigest()
+
+def conditional_html_response(body):
+    """Wrap a rendered page with an ETag, answering 304 when it is unchanged.
+
+    The ETag is memoized per body, so re-serving a cached page skips hashing.
+    """
+    response = Response(body, mimetype="text/html")
+    response.set_etag(_body_etag(body))
+    return response.make_conditional(request)
+
+def aggregate_status(components):
+    """Collapse component statuses to a single healthy/warning/error value."""
+    statuses = {component.get("status") for component in components.values()}
+    if "error" in statuses:
+        return "error"
+    if "warning" in statuses:
+        return "warning"
+    return "healthy"
+
 def create_error_response(error_type, message, status_code):
     """Create a standardized error response following the error schema."""
     return (
@@ -101,4 +149,19 @@ def get_component_status():
         components["openai_api"]["status"] = "error"
         components["openai_api"]["message"] = f"API connection error: {str(e)}"
     
-    return components
\ No newline at end of file
+    return components
+
+
+def get_cached_component_status(max_age=10):
+    """Return get_component_status(), re-probing at most every max_age seconds.
+
+    Lets the status and diagnostics pages share one set of external checks.
+    """
+    global _component_status_cache
+    with _component_status_lock:
+        timestamp, components = _component_status_cache
+        now = time.monotonic()
+        if components is None or now - timestamp >= max_age:
+            components = get_component_status()
+            _component_status_cache = (now, components)
+        return components
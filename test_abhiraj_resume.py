@@ -48,22 +48,16 @@ for height in page_heights:
     # Generate PDF from LaTeX
     print(f"Generating PDF with {height}in height...")
     try:
-        # Change to output directory to keep auxiliary files contained
-        original_dir = os.getcwd()
-        os.chdir(output_dir)
-        
-        # Run pdflatex (twice to resolve references)
+        # Run pdflatex (twice to resolve references) in the output directory to
+        # keep auxiliary files contained
         tex_filename = os.path.basename(tex_file)
         
         # Redirect stdout to null to reduce output clutter
         with open(os.devnull, 'w') as devnull:
             subprocess.run(['pdflatex', '-interaction=nonstopmode', tex_filename], 
-                          check=True, stdout=devnull)
+                          cwd=output_dir, check=True, stdout=devnull)
             subprocess.run(['pdflatex', '-interaction=nonstopmode', tex_filename], 
-                          check=True, stdout=devnull)
-        
-        # Return to original directory
-        os.chdir(original_dir)
+                          cwd=output_dir, check=True, stdout=devnull)
         
         pdf_file = os.path.join(output_dir, f'abhiraj_resume_{height}in.pdf')
         if os.path.exists(pdf_file):
@@ -90,9 +84,5 @@ for height in page_heights:
         print(f"Error during PDF generation: {e}")
     except Exception as e:
         print(f"Unexpected error during PDF generation: {e}")
-    finally:
-        # Ensure we return to the original directory even if there's an error
-        if 'original_dir' in locals():
-            os.chdir(original_dir)
 
 print("\nDone! Generated PDFs with different page heights.") 
\ No newline at end of file
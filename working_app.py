@@ -15,6 +15,14 @@ from werkzeug.middleware.proxy_fix import ProxyFix
 from flask import Flask, jsonify, request, g
 from flask_cors import CORS
 
+# Configure logging once for the whole application, before importing the
+# project modules: basicConfig is a no-op once any import has configured the
+# root logger. An entry point that configured logging first (render_entrypoint)
+# keeps its handlers.
+logging.basicConfig(
+    level=logging.INFO, format="%(levelname)s - %(message)s"
+)
+
 # Import the advanced modules
 from Endpoints.diagnostics import diagnostics_page
 from Endpoints.health import health_page
@@ -29,15 +37,12 @@ from Pipeline.resume_loading import OUTPUT_FOLDER, UPLOAD_FOLDER, download_resum
 from Services.database import get_db
 from Services.diagnostic_system import get_diagnostic_system
 from Services.errors import error_response
+from Services.json_provider import install_json_provider
 
 
 # Load environment variables
 load_dotenv()
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
 # Constants
@@ -74,6 +79,9 @@ def create_app():
     # Create Flask app
     app = Flask(__name__, template_folder="templates", static_folder="static")
     
+    # Serialize JSON responses with orjson when available
+    install_json_provider(app)
+    
     # Apply middleware
     app.wsgi_app = ProxyFix(app.wsgi_app)
     